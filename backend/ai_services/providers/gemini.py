@@ -89,7 +89,7 @@ Example response format:
             list(genai.list_models())
             return True
         except Exception as e:
-            logger.error(f"Invalid GEMINI_API_KEY: {str(e)}")
+            logger.error("Invalid GEMINI_API_KEY: %s", e)
             return False
 
     def _get_mime_type(self, file_path: str) -> Optional[str]:
@@ -131,26 +131,26 @@ Example response format:
 
         try:
             # Convert file to PDF if needed (DOCX, DOC, images)
-            logger.info(f"Checking if file needs conversion: {file_path}")
+            logger.info("Checking if file needs conversion: %s", file_path)
             if converter.needs_conversion(file_path):
-                logger.info(f"Converting file to PDF: {file_path}")
+                logger.info("Converting file to PDF: %s", file_path)
                 converted_file_path = converter.convert_to_pdf(file_path)
 
                 if not converted_file_path:
                     raise ValueError("File conversion to PDF failed")
 
-                logger.info(f"File converted successfully to: {converted_file_path}")
+                logger.info("File converted successfully to: %s", converted_file_path)
                 upload_file_path = converted_file_path
                 upload_mime_type = 'application/pdf'  # Converted files are always PDF
             else:
                 upload_file_path = file_path
                 upload_mime_type = self._get_mime_type(file_path)
 
-            logger.info(f"Uploading file to Gemini: {upload_file_path} (MIME type: {upload_mime_type})")
+            logger.info("Uploading file to Gemini: %s (MIME type: %s)", upload_file_path, upload_mime_type)
 
             # Upload file to Gemini with explicit MIME type
             uploaded_file = genai.upload_file(upload_file_path, mime_type=upload_mime_type)
-            logger.info(f"File uploaded successfully: {uploaded_file.name}")
+            logger.info("File uploaded successfully: %s", uploaded_file.name)
 
             # Generate content with the uploaded file
             logger.info("Generating content with Gemini model")
@@ -158,7 +158,7 @@ Example response format:
 
             # Parse the response
             response_text = response.text.strip()
-            logger.info(f"Gemini response: {response_text}")
+            logger.info("Gemini response: %s", response_text)
 
             # Try to extract JSON from the response
             # Sometimes the model returns markdown code blocks
@@ -174,7 +174,7 @@ Example response format:
             try:
                 extracted_data = json.loads(response_text)
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {response_text}")
+                logger.error("Failed to parse JSON response: %s", response_text)
                 raise ValueError(f"Invalid JSON response from AI: {str(e)}")
 
             # Validate the structure and extract all fields
@@ -191,15 +191,15 @@ Example response format:
                 'phone_number': extracted_data.get('phone_number') or (extracted_data.get('renters', [{}])[0].get('phone_number') if extracted_data.get('renters') else None),
             }
 
-            logger.info(f"Successfully extracted tenancy data: {result}")
+            logger.info("Successfully extracted tenancy data: %s", result)
             return result
 
         except Exception as e:
-            logger.error(f"Error extracting tenant data: {str(e)}")
+            logger.error("Error extracting tenant data: %s", e)
             raise Exception(f"Failed to extract tenant data: {str(e)}")
 
         finally:
             # Clean up converted file if one was created
             if converted_file_path:
                 converter.cleanup_all()
-                logger.info(f"Cleaned up converted file: {converted_file_path}")
+                logger.info("Cleaned up converted file: %s", converted_file_path)
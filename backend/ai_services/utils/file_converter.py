@@ -42,19 +42,19 @@ class FileConverter:
             Path to PDF file (either converted or original), or None if conversion fails
         """
         if not os.path.exists(input_path):
-            logger.error(f"Input file does not exist: {input_path}")
+            logger.error("Input file does not exist: %s", input_path)
             return None
 
         extension = Path(input_path).suffix.lower()
 
         # If already PDF, return original path
         if extension == '.pdf':
-            logger.info(f"File is already PDF: {input_path}")
+            logger.info("File is already PDF: %s", input_path)
             return input_path
 
         # Check if conversion is needed
         if not self.needs_conversion(input_path):
-            logger.warning(f"Unknown file type, attempting to use as-is: {extension}")
+            logger.warning("Unknown file type, attempting to use as-is: %s", extension)
             return input_path
 
         # Create temp file for output
@@ -69,19 +69,19 @@ class FileConverter:
             elif extension in ['.jpg', '.jpeg', '.png', '.webp']:
                 success = self._convert_image_to_pdf(input_path, output_path)
             else:
-                logger.error(f"Unsupported file type for conversion: {extension}")
+                logger.error("Unsupported file type for conversion: %s", extension)
                 return None
 
             if success and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                logger.info(f"Successfully converted {input_path} to PDF: {output_path}")
+                logger.info("Successfully converted %s to PDF: %s", input_path, output_path)
                 return output_path
             else:
-                logger.error(f"Conversion failed or produced empty file: {input_path}")
+                logger.error("Conversion failed or produced empty file: %s", input_path)
                 self._cleanup_file(output_path)
                 return None
 
         except Exception as e:
-            logger.error(f"Error converting file {input_path}: {str(e)}")
+            logger.error("Error converting file %s: %s", input_path, e)
             self._cleanup_file(output_path)
             return None
 
@@ -109,7 +109,7 @@ class FileConverter:
                 input_path
             ]
 
-            logger.info(f"Converting DOCX to PDF with LibreOffice: {input_path}")
+            logger.info("Converting DOCX to PDF with LibreOffice: %s", input_path)
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -118,7 +118,7 @@ class FileConverter:
             )
 
             if result.returncode != 0:
-                logger.error(f"LibreOffice conversion failed: {result.stderr}")
+                logger.error("LibreOffice conversion failed: %s", result.stderr)
                 return False
 
             # LibreOffice creates a PDF with the same name as input file
@@ -126,7 +126,7 @@ class FileConverter:
             libreoffice_output = os.path.join(temp_dir, f"{input_filename}.pdf")
 
             if not os.path.exists(libreoffice_output):
-                logger.error(f"LibreOffice did not create expected output file: {libreoffice_output}")
+                logger.error("LibreOffice did not create expected output file: %s", libreoffice_output)
                 return False
 
             # Move the file to desired output location
@@ -141,10 +141,10 @@ class FileConverter:
             return True
 
         except subprocess.TimeoutExpired:
-            logger.error(f"LibreOffice conversion timed out for {input_path}")
+            logger.error("LibreOffice conversion timed out for %s", input_path)
             return False
         except Exception as e:
-            logger.error(f"Error in DOCX to PDF conversion: {str(e)}")
+            logger.error("Error in DOCX to PDF conversion: %s", e)
             return False
 
     def _convert_image_to_pdf(self, input_path: str, output_path: str) -> bool:
@@ -159,7 +159,7 @@ class FileConverter:
             True if conversion successful, False otherwise
         """
         try:
-            logger.info(f"Converting image to PDF: {input_path}")
+            logger.info("Converting image to PDF: %s", input_path)
 
             # Open and convert image
             with Image.open(input_path) as img:
@@ -179,7 +179,7 @@ class FileConverter:
             return True
 
         except Exception as e:
-            logger.error(f"Error in image to PDF conversion: {str(e)}")
+            logger.error("Error in image to PDF conversion: %s", e)
             return False
 
     def _cleanup_file(self, file_path: str):
@@ -189,9 +189,9 @@ class FileConverter:
                 os.remove(file_path)
                 if file_path in self.temp_files:
                     self.temp_files.remove(file_path)
-                logger.debug(f"Cleaned up temporary file: {file_path}")
+                logger.debug("Cleaned up temporary file: %s", file_path)
         except Exception as e:
-            logger.warning(f"Failed to cleanup temporary file {file_path}: {str(e)}")
+            logger.warning("Failed to cleanup temporary file %s: %s", file_path, e)
 
     def cleanup_all(self):
         """Clean up all temporary files created during conversion."""
@@ -0,0 +1,16 @@
+"""
+Test settings: the regular settings with an in-memory SQLite database.
+
+Use for fast local runs even when DATABASE_ENGINE=postgresql is set:
+
+    DJANGO_SETTINGS_MODULE=config.settings_test pytest
+"""
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {'NAME': ':memory:'},
+    }
+}
@@ -4,13 +4,104 @@ Pytest configuration and shared fixtures.
 This file is automatically loaded by pytest and provides fixtures
 that are available to all test files.
 """
+import itertools
+import logging
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.backends.signals import connection_created
+from django.test import override_settings
 from rest_framework.test import APIClient
 
 User = get_user_model()
 
 
+def _tune_sqlite_connection(sender, connection, **kwargs):
+    """
+    Skip fsync and keep the rollback journal in memory for SQLite test
+    databases; a test database is thrown away, so durability buys nothing.
+    """
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous=OFF')
+            cursor.execute('PRAGMA journal_mode=MEMORY')
+
+
+connection_created.connect(_tune_sqlite_connection, dispatch_uid='tune_sqlite_test_connection')
+
+
+@pytest.fixture(scope='session', autouse=True)
+def fast_password_hasher():
+    """
+    Hash test passwords with MD5 instead of the default PBKDF2.
+
+    Every create_user() and check_password() call otherwise runs the full
+    PBKDF2 iteration count, which dominates fixture setup time.
+    """
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        yield
+
+
+@pytest.fixture(scope='session', autouse=True)
+def local_memory_cache():
+    """
+    Keep the cache in process memory even when REDIS_URL is configured.
+
+    clear_cache() empties the cache after every test, which on a shared
+    Redis would wipe entries belonging to other xdist workers. Each test
+    process is a single worker, so list response caching stays on.
+    """
+    with override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+        CACHE_LIST_RESPONSES=True
+    ):
+        yield
+
+
+@pytest.fixture(scope='session', autouse=True)
+def quiet_request_logger():
+    """
+    Silence the django.request logger for the test run.
+
+    Every 4xx response the tests provoke on purpose (401s, 403s, 404s)
+    is otherwise formatted and written as a warning.
+    """
+    logger = logging.getLogger('django.request')
+    previous_level = logger.level
+    logger.setLevel(logging.CRITICAL)
+    yield
+    logger.setLevel(previous_level)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Empty the cache after each test.
+
+    Database writes are rolled back between tests but cached values are
+    not, so they must not leak into the next test.
+    """
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def fast_invitation_token(monkeypatch):
+    """
+    Replace invitation token generation with a deterministic counter.
+
+    Only users.models.generate_invitation_token is patched, so the stdlib
+    secrets module stays untouched. Tokens stay unique within a test, and
+    tests that assert a token appears in an email or URL still hold.
+    """
+    counter = itertools.count()
+    monkeypatch.setattr(
+        'users.models.generate_invitation_token',
+        lambda: f't{next(counter):032d}'
+    )
+
+
 @pytest.fixture
 def api_client():
     """
@@ -0,0 +1,22 @@
+"""
+Project-wide REST framework pagination classes.
+
+This module provides the page-number pagination used by list endpoints,
+sized from the pagination constants in `project.constants`.
+"""
+from rest_framework.pagination import PageNumberPagination
+
+from project.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+class StandardPageNumberPagination(PageNumberPagination):
+    """
+    Page-number pagination with a client-adjustable page size.
+
+    Clients may request `?page_size=N` up to MAX_PAGE_SIZE; responses carry
+    `count`, `next`, `previous` and `results`.
+    """
+
+    page_size = DEFAULT_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
@@ -0,0 +1,51 @@
+"""
+Project-wide REST framework renderers.
+
+This module provides an orjson-backed JSON renderer used as the default
+renderer for API responses.
+"""
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that serializes with orjson.
+
+    Types orjson does not handle natively (Decimal, lazy translation strings,
+    querysets, ...) fall back to DRF's JSONEncoder so the output matches the
+    stock JSONRenderer.
+    """
+
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    _encoder = JSONEncoder()
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict | None = None
+    ) -> bytes:
+        """
+        Render `data` into JSON bytes.
+
+        Args:
+            data: The response data
+            accepted_media_type: The negotiated media type
+            renderer_context: Context passed by the view
+
+        Returns:
+            bytes: The encoded JSON document
+        """
+        if data is None:
+            return b''
+
+        options = self.options
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=self._encoder.default, option=options)
@@ -0,0 +1,45 @@
+"""
+Tests for REST framework pagination classes.
+"""
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from project.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from project.pagination import StandardPageNumberPagination
+
+
+def paginate(query=''):
+    """Paginate a plain list of integers for the given query string."""
+    request = Request(APIRequestFactory().get(f'/items/{query}'))
+    paginator = StandardPageNumberPagination()
+    page = paginator.paginate_queryset(list(range(250)), request)
+    return paginator, page
+
+
+class TestStandardPageNumberPagination:
+    """Test StandardPageNumberPagination behavior."""
+
+    def test_default_page_size(self):
+        """Test that pages default to DEFAULT_PAGE_SIZE items."""
+        _, page = paginate()
+        assert page == list(range(DEFAULT_PAGE_SIZE))
+
+    def test_page_size_query_param(self):
+        """Test that clients can choose a smaller page size."""
+        _, page = paginate('?page_size=5&page=2')
+        assert page == [5, 6, 7, 8, 9]
+
+    def test_page_size_capped(self):
+        """Test that the requested page size is capped at MAX_PAGE_SIZE."""
+        _, page = paginate('?page_size=1000')
+        assert len(page) == MAX_PAGE_SIZE
+
+    def test_paginated_response_shape(self):
+        """Test that the response carries count, links and results."""
+        paginator, page = paginate()
+        response = paginator.get_paginated_response(page)
+
+        assert response.data['count'] == 250
+        assert response.data['previous'] is None
+        assert 'page=2' in response.data['next']
+        assert response.data['results'] == page
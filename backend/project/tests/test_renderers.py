@@ -0,0 +1,37 @@
+"""
+Tests for REST framework renderers.
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from project.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Test ORJSONRenderer output."""
+
+    def test_render_none(self):
+        """Test that None renders as an empty body."""
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_render_dict(self):
+        """Test rendering a plain dictionary."""
+        content = ORJSONRenderer().render({'success': True, 'results': [1, 2]})
+        assert json.loads(content) == {'success': True, 'results': [1, 2]}
+
+    def test_render_decimal_as_string(self):
+        """Test that Decimal values fall back to DRF's encoding."""
+        content = ORJSONRenderer().render({'monthly_rent': Decimal('1500.00')})
+        assert json.loads(content) == {'monthly_rent': '1500.00'}
+
+    def test_render_utc_datetime_with_z_suffix(self):
+        """Test that UTC datetimes use the Z suffix like DRF's encoder."""
+        joined_at = datetime(2025, 1, 15, 12, 30, tzinfo=timezone.utc)
+        content = ORJSONRenderer().render({'joined_at': joined_at})
+        assert json.loads(content) == {'joined_at': '2025-01-15T12:30:00Z'}
+
+    def test_render_with_indent(self):
+        """Test that an indent in the media type produces indented output."""
+        content = ORJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        assert content == b'{\n  "a": 1\n}'
@@ -56,6 +56,9 @@ class HouseholdAdmin(admin.ModelAdmin):
     search_fields = ('name', 'address', 'landlord__email')
     readonly_fields = ('created_at', 'updated_at', 'member_count')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_member_counts()
+
 
 @admin.register(HouseholdMembership)
 class HouseholdMembershipAdmin(admin.ModelAdmin):
@@ -44,11 +44,11 @@ def send_welcome_email(user, temporary_password, landlord_name):
             fail_silently=False,
         )
 
-        logger.info(f"Welcome email sent successfully to {user.email}")
+        logger.info("Welcome email sent successfully to %s", user.email)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send welcome email to {user.email}: {str(e)}")
+        logger.error("Failed to send welcome email to %s: %s", user.email, e)
         return False
 
 
@@ -82,9 +82,9 @@ def send_password_changed_email(user):
             fail_silently=False,
         )
 
-        logger.info(f"Password changed confirmation email sent to {user.email}")
+        logger.info("Password changed confirmation email sent to %s", user.email)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send password changed email to {user.email}: {str(e)}")
+        logger.error("Failed to send password changed email to %s: %s", user.email, e)
         return False
@@ -1,11 +1,20 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Trim
 from django.utils import timezone
 from django.core.validators import RegexValidator
 import secrets
+import time
 from datetime import timedelta
 
 
+def generate_invitation_token():
+    """Return a new random URL-safe invitation token"""
+    return secrets.token_urlsafe(32)
+
+
 class UserManager(BaseUserManager):
     """Custom user manager for email-based authentication."""
 
@@ -115,6 +124,28 @@ class User(AbstractBaseUser, PermissionsMixin):
         full_name = f'{self.first_name} {self.last_name}'.strip()
         return full_name or self.email
 
+    @staticmethod
+    def full_name_expression(prefix=''):
+        """
+        Return a database expression equivalent to get_full_name().
+
+        Args:
+            prefix: Lookup path to the user, e.g. 'user__' when annotating renters
+        """
+        return Coalesce(
+            NullIf(
+                Trim(Concat(
+                    f'{prefix}first_name',
+                    Value(' '),
+                    f'{prefix}last_name',
+                    output_field=models.CharField()
+                )),
+                Value('')
+            ),
+            f'{prefix}email',
+            output_field=models.CharField()
+        )
+
     def get_short_name(self):
         """Return the first_name."""
         return self.first_name or self.email
@@ -129,6 +160,30 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.role == 'tenant'
 
 
+class HouseholdQuerySet(models.QuerySet):
+    """QuerySet for Household with list-view helpers."""
+
+    def with_member_counts(self):
+        """
+        Annotate each household with its active member count.
+
+        A correlated subquery rather than Count() over the join, so the
+        count stays correct on querysets already filtered through
+        memberships (e.g. a tenant's own households).
+        """
+        active_members = (
+            HouseholdMembership.objects
+            .filter(household=OuterRef('pk'), is_active=True)
+            .order_by()
+            .values('household')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+        return self.annotate(
+            _member_count=Coalesce(Subquery(active_members, output_field=IntegerField()), 0)
+        )
+
+
 class Household(models.Model):
     """A household/property managed by a landlord with multiple tenants."""
 
@@ -143,6 +198,8 @@ class Household(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    objects = HouseholdQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'household'
         verbose_name_plural = 'households'
@@ -151,8 +208,27 @@ class Household(models.Model):
     def __str__(self):
         return f"{self.name} - {self.landlord.email}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        cache.delete(self.onboarding_cache_key(self.landlord_id))
+        # Tenancy lists show the household name
+        Tenancy.invalidate_list_cache()
+
+    def delete(self, *args, **kwargs):
+        cache.delete(self.onboarding_cache_key(self.landlord_id))
+        Tenancy.invalidate_list_cache()
+        return super().delete(*args, **kwargs)
+
+    @staticmethod
+    def onboarding_cache_key(landlord_id):
+        """Cache key for the household/tenant flags of a landlord's onboarding status"""
+        return f'onb:{landlord_id}'
+
     @property
     def member_count(self):
+        # Use the with_member_counts() annotation when the queryset provided it
+        if hasattr(self, '_member_count'):
+            return self._member_count
         return self.memberships.filter(is_active=True).count()
 
 
@@ -193,6 +269,15 @@ class HouseholdMembership(models.Model):
     def __str__(self):
         return f"{self.tenant.email} in {self.household.name}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Joining or leaving changes the landlord's "tenants added" flag
+        cache.delete(Household.onboarding_cache_key(self.household.landlord_id))
+
+    def delete(self, *args, **kwargs):
+        cache.delete(Household.onboarding_cache_key(self.household.landlord_id))
+        return super().delete(*args, **kwargs)
+
 
 class TenancyAgreement(models.Model):
     """Tenancy agreement file with AI-extracted tenant data"""
@@ -304,6 +389,35 @@ class Tenancy(models.Model):
     def __str__(self):
         return f"{self.household.name} - {self.get_status_display()} ({self.start_date})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.invalidate_list_cache()
+
+    def delete(self, *args, **kwargs):
+        self.invalidate_list_cache()
+        return super().delete(*args, **kwargs)
+
+    LIST_CACHE_VERSION_KEY = 'tenancies:list:version'
+
+    @classmethod
+    def list_cache_key(cls, user_id, query):
+        """Cache key for a user's tenancy list page under the current list version"""
+        # A missing version starts from the clock so it never reuses an old one
+        version = cache.get_or_set(cls.LIST_CACHE_VERSION_KEY, time.time_ns, None)
+        return f'tenancies:list:v{version}:{user_id}:{query}'
+
+    @classmethod
+    def invalidate_list_cache(cls):
+        """Retire every cached tenancy list once the current transaction commits"""
+        def bump():
+            try:
+                cache.incr(cls.LIST_CACHE_VERSION_KEY)
+            except ValueError:
+                # No version yet; the next list_cache_key() starts a fresh one
+                pass
+
+        transaction.on_commit(bump)
+
     @property
     def renter_count(self):
         """Return the number of renters in this tenancy"""
@@ -373,6 +487,11 @@ class Renter(models.Model):
                 is_primary=True
             ).exclude(pk=self.pk).update(is_primary=False)
         super().save(*args, **kwargs)
+        Tenancy.invalidate_list_cache()
+
+    def delete(self, *args, **kwargs):
+        Tenancy.invalidate_list_cache()
+        return super().delete(*args, **kwargs)
 
 
 class TenantInvitation(models.Model):
@@ -400,16 +519,30 @@ class TenantInvitation(models.Model):
         verbose_name_plural = 'tenant invitations'
         unique_together = [['email', 'household']]  # One invitation per email per household
 
-    def save(self, *args, **kwargs):
+    def set_defaults(self):
+        """Fill in the token and expiry; called by save() and before bulk_create()"""
         # Auto-generate token if not set
         if not self.token:
-            self.token = secrets.token_urlsafe(32)
+            self.token = generate_invitation_token()
 
         # Auto-set expiration if not set (7 days from now)
         if not self.expires_at:
             self.expires_at = timezone.now() + timedelta(days=7)
 
+    def save(self, *args, **kwargs):
+        self.set_defaults()
         super().save(*args, **kwargs)
+        # Any change (acceptance, new expiry) makes a cached verify result stale
+        cache.delete(self.verify_cache_key(self.token))
+
+    def delete(self, *args, **kwargs):
+        cache.delete(self.verify_cache_key(self.token))
+        return super().delete(*args, **kwargs)
+
+    @staticmethod
+    def verify_cache_key(token):
+        """Cache key for the verify endpoint's response for this token"""
+        return f'inv:verify:{token}'
 
     def is_valid(self):
         """Check if invitation is still valid"""
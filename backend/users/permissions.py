@@ -1,5 +1,8 @@
 from rest_framework import permissions
 
+# Roles allowed through IsLandlordOrAdmin (superusers always are)
+LANDLORD_OR_ADMIN_ROLES = frozenset({'landlord', 'admin'})
+
 
 class IsLandlordOrAdmin(permissions.BasePermission):
     """
@@ -10,7 +13,7 @@ class IsLandlordOrAdmin(permissions.BasePermission):
         return (
             user and
             user.is_authenticated and
-            (user.role in ['landlord', 'admin'] or user.is_superuser)
+            (user.role in LANDLORD_OR_ADMIN_ROLES or user.is_superuser)
         )
 
 
@@ -23,8 +26,9 @@ class IsHouseholdLandlord(permissions.BasePermission):
         if request.user.is_superuser or request.user.role == 'admin':
             return True
 
-        # Check if the user is the landlord of the household
-        return obj.landlord == request.user
+        # Check if the user is the landlord of the household; comparing ids
+        # never loads the landlord row
+        return obj.landlord_id == request.user.pk
 
 
 class IsTenantOrLandlord(permissions.BasePermission):
@@ -37,7 +41,7 @@ class IsTenantOrLandlord(permissions.BasePermission):
             return True
 
         # Landlord of the household
-        if obj.landlord == request.user:
+        if obj.landlord_id == request.user.pk:
             return True
 
         # Tenant who is a member of the household
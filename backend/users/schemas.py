@@ -1,12 +1,33 @@
-from pydantic import BaseModel, EmailStr, field_validator, Field, model_validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator, Field, model_validator, StringConstraints
+from typing import Annotated, Optional, List
 from datetime import date
 from decimal import Decimal
 
+# Shared by every schema that accepts a phone number. Pydantic compiles a
+# Field pattern once, when the model's validator is built, not per call.
+PHONE_NUMBER_PATTERN = r'^\+?1?\d{9,15}$'
 
-class HouseholdOnboardingSchema(BaseModel):
+# Names are trimmed and must not be blank. pydantic-core applies these
+# constraints itself, so no Python validator runs per field.
+PersonName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=150)]
+TitleName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)]
+
+
+class DeferredSchema(BaseModel):
+    """
+    Base for the request/response schemas in this module.
+
+    Building a model's validator is the expensive part of defining it, and
+    this module is imported at startup by every process that loads the URL
+    conf. Deferring the build to the first validation keeps that cost off
+    management commands and worker boot for schemas they never use.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class HouseholdOnboardingSchema(DeferredSchema):
     """Schema for creating a household during onboarding"""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: TitleName
     # Accept either a single address field or detailed address components
     address: Optional[str] = None
     street_address: Optional[str] = None
@@ -14,12 +35,6 @@ class HouseholdOnboardingSchema(BaseModel):
     postal_code: Optional[str] = None
     country: Optional[str] = None
 
-    @field_validator('name')
-    def validate_name(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Household name cannot be empty')
-        return v.strip()
-
     def model_post_init(self, __context):
         """Construct full address from components if not provided"""
         if not self.address:
@@ -46,18 +61,12 @@ class HouseholdOnboardingSchema(BaseModel):
         self.address = self.address.strip()
 
 
-class LandlordUpdateSchema(BaseModel):
+class LandlordUpdateSchema(DeferredSchema):
     """Schema for updating landlord information"""
-    first_name: Optional[str] = Field(None, max_length=150)
-    last_name: Optional[str] = Field(None, max_length=150)
+    first_name: Optional[PersonName] = None
+    last_name: Optional[PersonName] = None
     email: Optional[EmailStr] = None
-    phone_number: Optional[str] = Field(None, pattern=r'^\+?1?\d{9,15}$')
-
-    @field_validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if v is not None and not v.strip():
-            raise ValueError('Name cannot be empty if provided')
-        return v.strip() if v else None
+    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_PATTERN)
 
     @field_validator('phone_number')
     def validate_phone_number(cls, v):
@@ -66,7 +75,7 @@ class LandlordUpdateSchema(BaseModel):
         return v.strip() if v else None
 
 
-class TenancyUploadSchema(BaseModel):
+class TenancyUploadSchema(DeferredSchema):
     """Schema for validating tenancy agreement upload"""
     household_id: int = Field(..., gt=0)
 
@@ -77,30 +86,30 @@ class TenancyUploadSchema(BaseModel):
         return v
 
 
-class TenantExtractedSchema(BaseModel):
+class TenantExtractedSchema(DeferredSchema):
     """Schema for extracted tenant data from AI (legacy single tenant)"""
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     email: Optional[EmailStr] = None
-    phone_number: Optional[str] = Field(None, pattern=r'^\+?1?\d{9,15}$')
+    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_PATTERN)
 
     class Config:
         from_attributes = True
 
 
-class RenterExtractedSchema(BaseModel):
+class RenterExtractedSchema(DeferredSchema):
     """Schema for a single extracted renter from AI"""
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     email: Optional[EmailStr] = None
-    phone_number: Optional[str] = Field(None, pattern=r'^\+?1?\d{9,15}$')
+    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_PATTERN)
     is_primary: bool = False
 
     class Config:
         from_attributes = True
 
 
-class TenancyExtractedSchema(BaseModel):
+class TenancyExtractedSchema(DeferredSchema):
     """Schema for complete extracted tenancy data from AI"""
     start_date: Optional[date] = None
     end_date: Optional[date] = None
@@ -137,22 +146,16 @@ class TenancyExtractedSchema(BaseModel):
         from_attributes = True
 
 
-class TenancyConfirmSchema(BaseModel):
+class TenancyConfirmSchema(DeferredSchema):
     """Schema for confirming tenancy creation with user input"""
     tenancy_agreement_id: int = Field(..., gt=0)
-    tenancy_name: str = Field(..., min_length=1, max_length=255)
+    tenancy_name: TitleName
     start_date: date
     end_date: Optional[date] = None
     monthly_rent: Decimal = Field(..., ge=0)
     deposit: Decimal = Field(default=Decimal('0.00'), ge=0)
     # Renters will be created separately in Step 4
 
-    @field_validator('tenancy_name')
-    def validate_name(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Tenancy name cannot be empty')
-        return v.strip()
-
     @model_validator(mode='after')
     def validate_dates(self):
         """Validate that end_date is after start_date"""
@@ -164,19 +167,13 @@ class TenancyConfirmSchema(BaseModel):
         from_attributes = True
 
 
-class TenantManualAddSchema(BaseModel):
+class TenantManualAddSchema(DeferredSchema):
     """Schema for manually adding a tenant"""
     household_id: int = Field(..., gt=0)
-    first_name: str = Field(..., min_length=1, max_length=150)
-    last_name: str = Field(..., min_length=1, max_length=150)
+    first_name: PersonName
+    last_name: PersonName
     email: EmailStr
-    phone_number: Optional[str] = Field(None, pattern=r'^\+?1?\d{9,15}$')
-
-    @field_validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Name cannot be empty')
-        return v.strip()
+    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_PATTERN)
 
     @field_validator('phone_number')
     def validate_phone_number(cls, v):
@@ -185,7 +182,7 @@ class TenantManualAddSchema(BaseModel):
         return v.strip() if v else None
 
 
-class OnboardingStatusSchema(BaseModel):
+class OnboardingStatusSchema(DeferredSchema):
     """Schema for onboarding status response"""
     is_onboarded: bool
     onboarding_step: int
@@ -197,7 +194,7 @@ class OnboardingStatusSchema(BaseModel):
         from_attributes = True
 
 
-class InvitationVerifySchema(BaseModel):
+class InvitationVerifySchema(DeferredSchema):
     """Schema for verifying an invitation token"""
     token: str = Field(..., min_length=1, max_length=64)
 
@@ -208,14 +205,14 @@ class InvitationVerifySchema(BaseModel):
         return v.strip()
 
 
-class InvitationAcceptSchema(BaseModel):
+class InvitationAcceptSchema(DeferredSchema):
     """Schema for accepting an invitation"""
     token: str = Field(..., min_length=1, max_length=64)
     password: str = Field(..., min_length=8, max_length=128)
     password_confirm: str = Field(..., min_length=8, max_length=128)
-    first_name: Optional[str] = Field(None, max_length=150)
-    last_name: Optional[str] = Field(None, max_length=150)
-    phone_number: Optional[str] = Field(None, pattern=r'^\+?1?\d{9,15}$')
+    first_name: Optional[PersonName] = None
+    last_name: Optional[PersonName] = None
+    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_PATTERN)
 
     @field_validator('token')
     def validate_token(cls, v):
@@ -229,12 +226,6 @@ class InvitationAcceptSchema(BaseModel):
             raise ValueError('Password must be at least 8 characters')
         return v
 
-    @field_validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if v is not None and not v.strip():
-            raise ValueError('Name cannot be empty if provided')
-        return v.strip() if v else None
-
     @field_validator('phone_number')
     def validate_phone_number(cls, v):
         if v is not None and not v.strip():
@@ -247,7 +238,7 @@ class InvitationAcceptSchema(BaseModel):
             raise ValueError('Passwords do not match')
 
 
-class InvitationCreateSchema(BaseModel):
+class InvitationCreateSchema(DeferredSchema):
     """Schema for creating a tenant invitation"""
     email: EmailStr
     household_id: int = Field(..., gt=0)
@@ -259,7 +250,7 @@ class InvitationCreateSchema(BaseModel):
         return v
 
 
-class InvitationResponseSchema(BaseModel):
+class InvitationResponseSchema(DeferredSchema):
     """Schema for invitation response data"""
     id: int
     email: str
@@ -279,21 +270,15 @@ class InvitationResponseSchema(BaseModel):
 
 # ==================== Tenancy Schemas ====================
 
-class RenterSchema(BaseModel):
+class RenterSchema(DeferredSchema):
     """Schema for adding a renter to a tenancy"""
     email: EmailStr
-    first_name: Optional[str] = Field(None, max_length=150)
-    last_name: Optional[str] = Field(None, max_length=150)
+    first_name: Optional[PersonName] = None
+    last_name: Optional[PersonName] = None
     is_primary: bool = False
 
-    @field_validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if v is not None and not v.strip():
-            raise ValueError('Name cannot be empty if provided')
-        return v.strip() if v else None
-
 
-class TenancyCreateSchema(BaseModel):
+class TenancyCreateSchema(DeferredSchema):
     """Schema for creating a new tenancy"""
     household_id: int = Field(..., gt=0)
     start_date: date
@@ -319,7 +304,7 @@ class TenancyCreateSchema(BaseModel):
         return self
 
 
-class TenancyUpdateSchema(BaseModel):
+class TenancyUpdateSchema(DeferredSchema):
     """Schema for updating a tenancy"""
     start_date: Optional[date] = None
     end_date: Optional[date] = None
@@ -343,21 +328,15 @@ class TenancyUpdateSchema(BaseModel):
         return self
 
 
-class AddRenterSchema(BaseModel):
+class AddRenterSchema(DeferredSchema):
     """Schema for adding a renter to an existing tenancy"""
     email: EmailStr
-    first_name: Optional[str] = Field(None, max_length=150)
-    last_name: Optional[str] = Field(None, max_length=150)
+    first_name: Optional[PersonName] = None
+    last_name: Optional[PersonName] = None
     is_primary: bool = False
 
-    @field_validator('first_name', 'last_name')
-    def validate_names(cls, v):
-        if v is not None and not v.strip():
-            raise ValueError('Name cannot be empty if provided')
-        return v.strip() if v else None
-
 
-class StartMoveoutSchema(BaseModel):
+class StartMoveoutSchema(DeferredSchema):
     """Schema for starting the move-out process"""
     end_date: date
 
@@ -370,7 +349,7 @@ class StartMoveoutSchema(BaseModel):
 
 # ==================== Password Management Schemas ====================
 
-class PasswordChangeSchema(BaseModel):
+class PasswordChangeSchema(DeferredSchema):
     """Schema for changing password"""
     current_password: str = Field(..., min_length=1)
     new_password: str = Field(..., min_length=8, max_length=128)
@@ -1,8 +1,60 @@
+import hmac
+import operator
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.password_validation import validate_password
+from django.db.models import OuterRef, Prefetch, Subquery
 from .models import User, Household, HouseholdMembership, TenancyAgreement, TenantInvitation, Tenancy, Renter
 
+# Roles a user may pick when self-registering
+REGISTRATION_ROLE_CHOICES = ('landlord', 'tenant')
+
+
+class EagerLoadingMixin:
+    """
+    Declare the joins a serializer needs so viewsets can eager-load them.
+
+    Subclasses list the relations their fields traverse; viewsets call
+    ``setup_eager_loading`` on their queryset instead of hand-writing
+    ``select_related``/``prefetch_related`` calls that drift out of sync.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Apply the serializer's declared joins to the queryset."""
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
+
+
+class FlatRepresentationMixin:
+    """
+    Fast read path for serializers made only of plain model attributes.
+
+    The getter for ``Meta.fields`` is built once when the class is created,
+    so ``to_representation`` reads every value in a single attrgetter call
+    instead of dispatching through one Field object per attribute. Only use
+    it for read-only serializers whose fields are concrete columns holding
+    JSON-ready values (str, int, bool or None).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = tuple(cls.Meta.fields)
+        getter = operator.attrgetter(*fields)
+        if len(fields) == 1:
+            cls._get_field_values = staticmethod(lambda instance: (getter(instance),))
+        else:
+            cls._get_field_values = staticmethod(getter)
+        cls._flat_field_names = fields
+
+    def to_representation(self, instance):
+        return dict(zip(self._flat_field_names, self._get_field_values(instance)))
+
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for user data."""
@@ -41,7 +93,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         style={'input_type': 'password'}
     )
     role = serializers.ChoiceField(
-        choices=['landlord', 'tenant'],
+        choices=REGISTRATION_ROLE_CHOICES,
         required=False,
         default='tenant'
     )
@@ -60,7 +112,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         """Validate that passwords match."""
-        if attrs['password'] != attrs['password_confirm']:
+        if not hmac.compare_digest(attrs['password'].encode(), attrs['password_confirm'].encode()):
             raise serializers.ValidationError({
                 'password': 'Password fields did not match.'
             })
@@ -99,7 +151,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return data
 
 
-class LandlordSerializer(serializers.ModelSerializer):
+class LandlordSerializer(FlatRepresentationMixin, serializers.ModelSerializer):
     """Simplified user serializer for landlord data."""
 
     class Meta:
@@ -108,8 +160,9 @@ class LandlordSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class HouseholdSerializer(serializers.ModelSerializer):
+class HouseholdSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for Household model."""
+    select_related_fields = ('landlord',)
     member_count = serializers.ReadOnlyField()
     landlord = LandlordSerializer(read_only=True)
 
@@ -127,9 +180,15 @@ class HouseholdSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'landlord', 'created_at', 'updated_at')
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Also annotate member_count so listing households stays one query."""
+        return super().setup_eager_loading(queryset).with_member_counts()
+
 
-class HouseholdMembershipSerializer(serializers.ModelSerializer):
+class HouseholdMembershipSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for HouseholdMembership model."""
+    select_related_fields = ('tenant',)
     tenant_email = serializers.EmailField(source='tenant.email', read_only=True)
     tenant_name = serializers.CharField(source='tenant.get_full_name', read_only=True)
 
@@ -149,8 +208,9 @@ class HouseholdMembershipSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'joined_at')
 
 
-class TenancyAgreementSerializer(serializers.ModelSerializer):
+class TenancyAgreementSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for TenancyAgreement model."""
+    select_related_fields = ('household', 'tenant')
     tenant_email = serializers.EmailField(source='tenant.email', read_only=True, allow_null=True)
     household_name = serializers.CharField(source='household.name', read_only=True)
 
@@ -170,8 +230,9 @@ class TenancyAgreementSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'uploaded_at', 'extracted_data', 'status')
 
 
-class TenantInvitationSerializer(serializers.ModelSerializer):
+class TenantInvitationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for TenantInvitation model."""
+    select_related_fields = ('household', 'invited_by')
     household_name = serializers.CharField(source='household.name', read_only=True)
     invited_by_name = serializers.CharField(source='invited_by.get_full_name', read_only=True)
     is_valid = serializers.SerializerMethodField()
@@ -216,7 +277,7 @@ class InvitationAcceptSerializer(serializers.Serializer):
     phone_number = serializers.CharField(required=False, allow_blank=True)
 
     def validate(self, attrs):
-        if attrs['password'] != attrs['password_confirm']:
+        if not hmac.compare_digest(attrs['password'].encode(), attrs['password_confirm'].encode()):
             raise serializers.ValidationError({
                 'password': 'Password fields did not match.'
             })
@@ -225,7 +286,7 @@ class InvitationAcceptSerializer(serializers.Serializer):
 
 # ==================== Tenancy Serializers ====================
 
-class RenterUserSerializer(serializers.ModelSerializer):
+class RenterUserSerializer(FlatRepresentationMixin, serializers.ModelSerializer):
     """Simplified user serializer for renter data."""
 
     class Meta:
@@ -233,9 +294,15 @@ class RenterUserSerializer(serializers.ModelSerializer):
         fields = ('id', 'email', 'first_name', 'last_name', 'phone_number')
         read_only_fields = fields
 
+    @classmethod
+    def get_prefetch(cls, lookup):
+        """Prefetch users for ``lookup`` loading only the columns this serializer renders."""
+        return Prefetch(lookup, queryset=User.objects.only(*cls.Meta.fields))
 
-class RenterSerializer(serializers.ModelSerializer):
+
+class RenterSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for Renter model."""
+    select_related_fields = ('user',)
     user = RenterUserSerializer(read_only=True)
     user_id = serializers.IntegerField(write_only=True, required=False)
 
@@ -252,8 +319,10 @@ class RenterSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'joined_at')
 
 
-class TenancySerializer(serializers.ModelSerializer):
+class TenancySerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for Tenancy model."""
+    select_related_fields = ('household',)
+    prefetch_related_fields = (RenterUserSerializer.get_prefetch('renters__user'),)
     household_name = serializers.CharField(source='household.name', read_only=True)
     renter_count = serializers.ReadOnlyField()
     renters = RenterSerializer(many=True, read_only=True)
@@ -323,8 +392,11 @@ class TenancySerializer(serializers.ModelSerializer):
         return attrs
 
 
-class TenancyListSerializer(serializers.ModelSerializer):
+class TenancyListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Simplified serializer for listing tenancies."""
+    select_related_fields = ('household',)
+    # Renters are only counted here; the primary renter is annotated
+    prefetch_related_fields = (Prefetch('renters', queryset=Renter.objects.only('id', 'tenancy')),)
     household_name = serializers.CharField(source='household.name', read_only=True)
     renter_count = serializers.ReadOnlyField()
     primary_renter = serializers.SerializerMethodField()
@@ -348,13 +420,49 @@ class TenancyListSerializer(serializers.ModelSerializer):
         )
         read_only_fields = fields
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Also annotate the primary renter's id, full name and email.
+
+        Only the columns rendered here are loaded, so the agreement file
+        paths and the rest of the household row stay in the database.
+        """
+        queryset = super().setup_eager_loading(queryset).only(
+            *(field for field in cls.Meta.fields if field not in cls._declared_fields),
+            'household__name'
+        )
+        primary = Renter.objects.filter(
+            tenancy=OuterRef('pk'),
+            is_primary=True
+        ).order_by('joined_at')
+        return queryset.annotate(
+            primary_renter_user_id=Subquery(primary.values('user_id')[:1]),
+            primary_renter_name=Subquery(
+                primary.annotate(
+                    full_name=User.full_name_expression(prefix='user__')
+                ).values('full_name')[:1]
+            ),
+            primary_renter_email=Subquery(primary.values('user__email')[:1]),
+        )
+
     def get_primary_renter(self, obj):
         """Get the primary renter name."""
-        primary = obj.primary_renter
-        if primary:
-            return {
-                'id': primary.user.id,
-                'name': primary.user.get_full_name(),
-                'email': primary.user.email,
-            }
-        return None
+        if not hasattr(obj, 'primary_renter_user_id'):
+            # Instance did not come through setup_eager_loading
+            primary = obj.primary_renter
+            if primary:
+                return {
+                    'id': primary.user.id,
+                    'name': primary.user.get_full_name(),
+                    'email': primary.user.email,
+                }
+            return None
+
+        if obj.primary_renter_user_id is None:
+            return None
+        return {
+            'id': obj.primary_renter_user_id,
+            'name': obj.primary_renter_name,
+            'email': obj.primary_renter_email,
+        }
@@ -0,0 +1,97 @@
+"""Background work for the users app."""
+import logging
+import threading
+from functools import lru_cache
+
+from django.db import connection, transaction
+
+from .emails import send_welcome_email
+from .models import TenancyAgreement
+
+logger = logging.getLogger(__name__)
+
+
+def run_after_commit(func, *args):
+    """
+    Run ``func(*args)`` on a daemon thread once the current transaction commits.
+
+    The project has no task queue, so slow work that the response does not
+    depend on is handed to a thread instead. Nothing runs if the transaction
+    rolls back; outside a transaction the thread starts immediately.
+    Exceptions are logged rather than raised.
+
+    Args:
+        func: Callable to run in the background
+        *args: Positional arguments for func
+    """
+    def run():
+        try:
+            func(*args)
+        except Exception:
+            logger.exception('Background task %s failed', func.__name__)
+        finally:
+            # The thread opened its own connection if func touched the database
+            connection.close()
+
+    transaction.on_commit(lambda: threading.Thread(target=run, daemon=True).start())
+
+
+@lru_cache(maxsize=None)
+def get_extraction_provider():
+    """
+    Return the process-wide AI provider used for tenancy agreement extraction.
+
+    Building a provider configures the Gemini client, so it is done once per
+    worker process rather than once per document. The import is deferred so
+    the AI dependencies are only needed when extraction actually runs.
+    """
+    from ai_services.providers import GeminiProvider
+    return GeminiProvider()
+
+
+def extract_tenancy_agreement(agreement_id):
+    """
+    Run AI extraction on an uploaded tenancy agreement and store the result.
+
+    The agreement moves from 'pending' to 'processing' while the provider
+    runs and ends up 'processed' with its extracted data, or 'failed'. If
+    the agreement is no longer pending (the process endpoint claimed it),
+    nothing is done. A thread killed mid-run leaves the agreement
+    'processing'; the process endpoint takes such agreements over once
+    they are stale.
+
+    Args:
+        agreement_id: Primary key of the TenancyAgreement to process
+    """
+    agreements = TenancyAgreement.objects.filter(pk=agreement_id)
+    if not agreements.filter(status='pending').update(status='processing'):
+        return
+    agreement = agreements.only('file').get()
+
+    try:
+        extracted_data = get_extraction_provider().extract_tenant_data(agreement.file.path)
+    except Exception as extraction_error:
+        logger.error("Error extracting tenant data from agreement %s: %s", agreement_id, extraction_error)
+        agreements.update(status='failed')
+        return
+
+    agreements.update(extracted_data=extracted_data, status='processed')
+    logger.info("Successfully extracted data from tenancy agreement %s", agreement_id)
+
+
+def welcome_new_tenant(tenant, temporary_password, landlord_name):
+    """
+    Set a newly created tenant's temporary password and email it to them.
+
+    Hashing the password is deliberately slow, so it happens here rather
+    than inside the request's transaction; the account has no usable
+    password until then.
+
+    Args:
+        tenant: The new tenant User, created without a password
+        temporary_password: Plain-text password to set and send
+        landlord_name: Name of the landlord who added the tenant
+    """
+    tenant.set_password(temporary_password)
+    tenant.save(update_fields=['password'])
+    send_welcome_email(tenant, temporary_password, landlord_name)
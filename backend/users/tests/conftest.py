@@ -0,0 +1,179 @@
+"""
+Shared fixtures for the users app tests.
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.template.loader import get_template
+from django.test import Client
+from rest_framework.test import APIClient
+from users.models import Household, TenancyAgreement, TenantInvitation
+
+User = get_user_model()
+
+# Field values of the shared rows; tests assert against several of them.
+# The shared users never log in (clients use force_authenticate), so they
+# get unusable passwords and skip hashing altogether.
+LANDLORD_FIELDS = {
+    'email': 'landlord@example.com',
+    'role': 'landlord',
+    'first_name': 'John',
+    'last_name': 'Doe',
+}
+TENANT_FIELDS = {
+    'email': 'tenant@example.com',
+    'role': 'tenant',
+    'first_name': 'Jane',
+    'last_name': 'Smith',
+}
+HOUSEHOLD_FIELDS = {
+    'name': 'Test Apartment',
+    'address': '123 Main St',
+}
+
+# What FakeProvider "extracts" from every tenancy agreement
+EXTRACTED = {'start_date': '2025-01-01', 'monthly_rent': 1500, 'renters': []}
+
+
+class FakeProvider:
+    """Stand-in for GeminiProvider that returns canned data"""
+
+    def extract_tenant_data(self, file_path):
+        return EXTRACTED
+
+
+@pytest.fixture(scope='session')
+def api_client():
+    """One APIClient for the whole run; reset_api_client clears it between tests"""
+    return APIClient()
+
+
+@pytest.fixture(autouse=True)
+def reset_api_client(request):
+    """
+    Drop forced authentication, credentials and cookies left on the shared
+    api_client by the test that just ran.
+
+    Resets the handler directly: APIClient.logout() (also reached through
+    force_authenticate(None)) would create and save a session row.
+    """
+    client = request.getfixturevalue('api_client') if 'api_client' in request.fixturenames else None
+    yield
+    if client is not None:
+        client.handler._force_user = None
+        client.handler._force_token = None
+        client.credentials()
+        client.cookies.clear()
+
+
+def create_shared_user(fields):
+    """
+    Create a user shared across tests, outside the per-test transaction.
+
+    --reuse-db keeps the database between runs, so an interrupted run can
+    leave the row behind; any leftover copy is deleted first.
+    """
+    User.objects.filter(email=fields['email']).delete()
+    user = User(**fields)
+    user.set_unusable_password()
+    user.save()
+    return user
+
+
+@pytest.fixture(scope='module')
+def landlord(django_db_setup, django_db_blocker):
+    # Created once per module outside the per-test transaction; each test
+    # only rolls back its own writes
+    with django_db_blocker.unblock():
+        landlord = create_shared_user(LANDLORD_FIELDS)
+    try:
+        yield landlord
+    finally:
+        with django_db_blocker.unblock():
+            landlord.delete()
+
+
+@pytest.fixture(scope='module')
+def tenant(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        tenant = create_shared_user(TENANT_FIELDS)
+    try:
+        yield tenant
+    finally:
+        with django_db_blocker.unblock():
+            tenant.delete()
+
+
+@pytest.fixture(scope='module')
+def household(landlord, django_db_blocker):
+    # Leftover households went with their landlord in create_shared_user()
+    with django_db_blocker.unblock():
+        household = Household.objects.create(landlord=landlord, **HOUSEHOLD_FIELDS)
+    try:
+        yield household
+    finally:
+        with django_db_blocker.unblock():
+            household.delete()
+
+
+@pytest.fixture
+def invitation_email():
+    """Email address valid_invitation is sent to; override to change it"""
+    return 'tenant@example.com'
+
+
+@pytest.fixture
+def valid_invitation(household, landlord, invitation_email):
+    return TenantInvitation.objects.create(
+        email=invitation_email,
+        household=household,
+        invited_by=landlord
+    )
+
+
+@pytest.fixture
+def agreement(household):
+    """Pending tenancy agreement for the shared household"""
+    return TenancyAgreement.objects.create(household=household, file='agreements/test.pdf')
+
+
+@pytest.fixture(autouse=True)
+def reload_shared_rows(request):
+    """
+    Reload the shared landlord, tenant and household rows before each test.
+
+    The database rolls back after every test but the shared Python objects
+    do not, so a view that edits request.user (the onboarding step, landlord
+    updates) would otherwise leak into the next test through
+    force_authenticate().
+    """
+    for name in ('landlord', 'tenant', 'household'):
+        if name in request.fixturenames:
+            request.getfixturevalue(name).refresh_from_db()
+
+
+@pytest.fixture
+def landlord_client(landlord):
+    """
+    API client authenticated as the shared landlord.
+
+    force_authenticate() swaps DRF's authentication classes for a forced
+    user, so requests skip JWT decoding and the user lookup entirely.
+    """
+    client = APIClient()
+    client.force_authenticate(user=landlord)
+    return client
+
+
+@pytest.fixture
+def plain_client():
+    """Django test client for status-code checks that don't need APIClient"""
+    return Client()
+
+
+@pytest.fixture(scope='session')
+def invitation_email_templates():
+    """Compile the invitation email templates once into the cached template loader"""
+    return [
+        get_template('emails/tenant_invitation.html'),
+        get_template('emails/tenant_invitation.txt'),
+    ]
@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
 from users.models import Household, HouseholdMembership
+from users.serializers import HouseholdSerializer, UserSerializer
 
 User = get_user_model()
 
@@ -65,6 +66,57 @@ class TestHouseholdViewSet:
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['name'] == 'Test Apartment'
 
+    def test_list_households_query_count(self, api_client, landlord_user, django_assert_num_queries):
+        """Test that listing households with members does not query per household"""
+        households = Household.objects.bulk_create([
+            Household(name=f'Apartment {i}', address=f'{i} Main St', landlord=landlord_user)
+            for i in range(3)
+        ])
+        tenants = User.objects.bulk_create([
+            User(email=f'tenant{i}@example.com', role='tenant')
+            for i in range(3)
+        ])
+        HouseholdMembership.objects.bulk_create([
+            HouseholdMembership(household=household, tenant=tenant, invited_by=landlord_user)
+            for household, tenant in zip(households, tenants)
+        ])
+
+        api_client.force_authenticate(user=landlord_user)
+        # Page count, the page of households, and the prefetched memberships
+        with django_assert_num_queries(3):
+            response = api_client.get('/api/users/households/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 3
+        assert all(len(result['members']) == 1 for result in response.data['results'])
+
+    def test_list_households_paginated(self, api_client, landlord_user):
+        """Test that the household list is returned a page at a time"""
+        Household.objects.bulk_create([
+            Household(name=f'Apartment {i}', address=f'{i} Main St', landlord=landlord_user)
+            for i in range(3)
+        ])
+
+        api_client.force_authenticate(user=landlord_user)
+        response = api_client.get('/api/users/households/', {'page_size': 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        assert len(response.data['results']) == 2
+        assert response.data['next'] is not None
+
+    def test_list_households_match_household_serializer(self, api_client, landlord_user, household):
+        """Test that listed households render exactly like HouseholdSerializer"""
+        api_client.force_authenticate(user=landlord_user)
+        response = api_client.get('/api/users/households/')
+
+        expected = HouseholdSerializer(
+            Household.objects.with_member_counts().select_related('landlord').get(pk=household.pk)
+        ).data
+        listed = dict(response.data['results'][0])
+        listed.pop('members')
+        assert listed == expected
+
     def test_list_households_as_regular_user(self, api_client):
         """Test that regular users with no memberships get empty list"""
         user = User.objects.create_user(
@@ -115,6 +167,7 @@ class TestHouseholdViewSet:
         assert 'members' in response.data
         assert len(response.data['members']) == 1
         assert response.data['members'][0]['tenant']['email'] == 'tenant@example.com'
+        assert response.data['members'][0]['tenant'] == UserSerializer(tenant_user).data
 
     def test_update_household(self, api_client, landlord_user, household):
         """Test updating a household"""
@@ -165,6 +218,21 @@ class TestHouseholdViewSet:
             tenant=new_user
         ).exists()
 
+    @pytest.mark.parametrize('email', ['not-an-email', 'missing@tld', 'two@@example.com'])
+    def test_add_member_invalid_email(self, api_client, landlord_user, household, email,
+                                      django_assert_num_queries):
+        """Test that malformed emails are rejected without looking up users"""
+        api_client.force_authenticate(user=landlord_user)
+
+        # Only the household lookup for the permission check runs
+        with django_assert_num_queries(1):
+            response = api_client.post(
+                f'/api/users/households/{household.id}/add_member/', {'email': email}
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not User.objects.filter(email=email).exists()
+
     def test_add_existing_member_to_household(self, api_client, landlord_user, household, tenant_user):
         """Test adding an existing user to household"""
         api_client.force_authenticate(user=landlord_user)
@@ -196,6 +264,25 @@ class TestHouseholdViewSet:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'already a member' in response.data['error'].lower()
 
+    def test_re_add_removed_member(self, api_client, landlord_user, household, tenant_user):
+        """Test that adding a previously removed member reactivates the membership"""
+        membership = HouseholdMembership.objects.create(
+            household=household,
+            tenant=tenant_user,
+            role='tenant',
+            invited_by=landlord_user,
+            is_active=False
+        )
+
+        api_client.force_authenticate(user=landlord_user)
+        data = {'email': tenant_user.email}
+        response = api_client.post(f'/api/users/households/{household.id}/add_member/', data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['id'] == membership.id
+        membership.refresh_from_db()
+        assert membership.is_active is True
+
     def test_remove_member_from_household(self, api_client, landlord_user, household, tenant_user):
         """Test removing a member from household"""
         # Add member first
@@ -259,3 +346,17 @@ class TestHouseholdViewSet:
         assert 'members' in response.data
         assert len(response.data['members']) == 1
         assert response.data['members'][0]['tenant']['email'] == tenant_user.email
+
+    def test_household_members_match_user_serializer(self, api_client, landlord_user, household, tenant_user):
+        """Test that the members action renders tenants exactly like UserSerializer"""
+        HouseholdMembership.objects.create(
+            household=household,
+            tenant=tenant_user,
+            role='tenant',
+            invited_by=landlord_user
+        )
+
+        api_client.force_authenticate(user=landlord_user)
+        response = api_client.get(f'/api/users/households/{household.id}/members/')
+
+        assert response.data['members'][0]['tenant'] == UserSerializer(tenant_user).data
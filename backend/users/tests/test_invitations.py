@@ -1,53 +1,42 @@
+import json
 import pytest
 from datetime import timedelta
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core import mail
-from rest_framework.test import APIClient
+from django.urls import reverse
 from rest_framework import status
 from users.models import Household, HouseholdMembership, TenantInvitation
 from users.views.invitations import send_invitation_email
 
 User = get_user_model()
 
+# Reversed once at import; pytest-django configures Django before collection
+VERIFY_URL = reverse('users:invitation-verify')
+ACCEPT_URL = reverse('users:invitation-accept')
+LIST_URL = reverse('users:invitation-list')
 
-@pytest.mark.django_db
-class TestInvitationVerifyEndpoint:
-    """Test suite for invitation verify endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
+def build_invitation(email, household, invited_by):
+    """Build an unsaved invitation with the fields save() would fill in, for bulk_create()"""
+    invitation = TenantInvitation(email=email, household=household, invited_by=invited_by)
+    invitation.set_defaults()
+    return invitation
 
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
 
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
-        )
+def post_json(client, url, payload):
+    """POST payload as a JSON body rather than multipart form data"""
+    return client.post(url, data=json.dumps(payload), content_type='application/json')
 
-    @pytest.fixture
-    def valid_invitation(self, household, landlord):
-        return TenantInvitation.objects.create(
-            email='tenant@example.com',
-            household=household,
-            invited_by=landlord
-        )
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('fast_invitation_token')
+class TestInvitationVerifyEndpoint:
+    """Test suite for invitation verify endpoint"""
 
     def test_verify_valid_token(self, api_client, valid_invitation):
         """Test verifying a valid invitation token"""
-        response = api_client.post('/api/users/invitations/verify/', {
+        response = post_json(api_client, VERIFY_URL, {
             'token': valid_invitation.token
         })
 
@@ -57,15 +46,26 @@ class TestInvitationVerifyEndpoint:
         assert response.data['household_name'] == 'Test Apartment'
         assert 'John Doe' in response.data['invited_by']
 
-    def test_verify_invalid_token(self, api_client):
+    def test_verify_valid_token_query_count(self, api_client, valid_invitation,
+                                            django_assert_num_queries):
+        """Test verify loads the invitation, household and inviter in one query"""
+        with django_assert_num_queries(1):
+            response = post_json(api_client, VERIFY_URL, {
+                'token': valid_invitation.token
+            })
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'John Doe' in response.data['invited_by']
+
+    def test_verify_invalid_token(self, plain_client):
         """Test verifying an invalid invitation token"""
-        response = api_client.post('/api/users/invitations/verify/', {
+        response = post_json(plain_client, VERIFY_URL, {
             'token': 'invalid-token-123'
         })
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
-        assert 'error' in response.data
-        assert 'Invalid invitation token' in response.data['error']
+        assert 'error' in response.json()
+        assert 'Invalid invitation token' in response.json()['error']
 
     def test_verify_expired_token(self, api_client, household, landlord):
         """Test verifying an expired invitation token"""
@@ -78,7 +78,7 @@ class TestInvitationVerifyEndpoint:
         invitation.expires_at = timezone.now() - timedelta(days=1)
         invitation.save()
 
-        response = api_client.post('/api/users/invitations/verify/', {
+        response = post_json(api_client, VERIFY_URL, {
             'token': invitation.token
         })
 
@@ -96,7 +96,7 @@ class TestInvitationVerifyEndpoint:
         # Mark as accepted
         invitation.accept()
 
-        response = api_client.post('/api/users/invitations/verify/', {
+        response = post_json(api_client, VERIFY_URL, {
             'token': invitation.token
         })
 
@@ -104,18 +104,33 @@ class TestInvitationVerifyEndpoint:
         assert 'error' in response.data
         assert 'accepted' in response.data['error'].lower()
 
-    def test_verify_missing_token(self, api_client):
+    def test_verify_cached_result_cleared_on_accept(self, api_client, valid_invitation):
+        """Test that accepting an invitation invalidates its cached verify result"""
+        response = post_json(api_client, VERIFY_URL, {
+            'token': valid_invitation.token
+        })
+        assert response.status_code == status.HTTP_200_OK
+
+        valid_invitation.accept()
+
+        response = post_json(api_client, VERIFY_URL, {
+            'token': valid_invitation.token
+        })
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'accepted' in response.data['error'].lower()
+
+    def test_verify_missing_token(self, plain_client):
         """Test verifying without providing a token"""
-        response = api_client.post('/api/users/invitations/verify/', {})
+        response = post_json(plain_client, VERIFY_URL, {})
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'error' in response.data
-        assert 'required' in response.data['error'].lower()
+        assert 'error' in response.json()
+        assert 'required' in response.json()['error'].lower()
 
     def test_verify_no_authentication_required(self, api_client, valid_invitation):
         """Test that verify endpoint doesn't require authentication"""
         # Should work without authentication
-        response = api_client.post('/api/users/invitations/verify/', {
+        response = post_json(api_client, VERIFY_URL, {
             'token': valid_invitation.token
         })
 
@@ -123,42 +138,17 @@ class TestInvitationVerifyEndpoint:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('fast_invitation_token')
 class TestInvitationAcceptEndpoint:
     """Test suite for invitation accept endpoint"""
 
     @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
-
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
-        )
-
-    @pytest.fixture
-    def valid_invitation(self, household, landlord):
-        return TenantInvitation.objects.create(
-            email='newtenant@example.com',
-            household=household,
-            invited_by=landlord
-        )
+    def invitation_email(self):
+        return 'newtenant@example.com'
 
-    def test_accept_invitation_new_user(self, api_client, valid_invitation, household):
+    def test_accept_invitation_new_user(self, api_client, valid_invitation, household, django_assert_num_queries):
         """Test accepting invitation creates new user"""
-        response = api_client.post('/api/users/invitations/accept/', {
+        response = post_json(api_client, ACCEPT_URL, {
             'token': valid_invitation.token,
             'password': 'newpassword123',
             'password_confirm': 'newpassword123',
@@ -171,8 +161,16 @@ class TestInvitationAcceptEndpoint:
         assert 'user_id' in response.data
         assert response.data['email'] == 'newtenant@example.com'
 
+        # Load the new membership with its user, and the invitation's acceptance
+        with django_assert_num_queries(2):
+            membership = HouseholdMembership.objects.select_related('tenant').get(
+                household=household,
+                tenant__email='newtenant@example.com'
+            )
+            valid_invitation.refresh_from_db(fields=['accepted_at'])
+
         # Verify user was created
-        user = User.objects.get(email='newtenant@example.com')
+        user = membership.tenant
         assert user.first_name == 'Jane'
         assert user.last_name == 'Smith'
         assert user.phone_number == '+31612345678'
@@ -181,11 +179,9 @@ class TestInvitationAcceptEndpoint:
         assert user.check_password('newpassword123')
 
         # Verify membership was created
-        membership = HouseholdMembership.objects.get(household=household, tenant=user)
         assert membership.role == 'tenant'
 
         # Verify invitation was marked as accepted
-        valid_invitation.refresh_from_db()
         assert valid_invitation.accepted_at is not None
 
     def test_accept_invitation_inactive_user(self, api_client, household, landlord):
@@ -204,7 +200,7 @@ class TestInvitationAcceptEndpoint:
             invited_by=landlord
         )
 
-        response = api_client.post('/api/users/invitations/accept/', {
+        response = post_json(api_client, ACCEPT_URL, {
             'token': invitation.token,
             'password': 'newpassword123',
             'password_confirm': 'newpassword123',
@@ -221,79 +217,67 @@ class TestInvitationAcceptEndpoint:
         assert inactive_user.last_name == 'Smith'
         assert inactive_user.check_password('newpassword123')
 
-    def test_accept_invitation_password_mismatch(self, api_client, valid_invitation):
-        """Test accepting invitation with mismatched passwords"""
-        response = api_client.post('/api/users/invitations/accept/', {
-            'token': valid_invitation.token,
-            'password': 'password123',
-            'password_confirm': 'different123',
-            'first_name': 'Jane',
-            'last_name': 'Smith'
-        })
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'password' in str(response.data).lower()
-
-    def test_accept_invitation_short_password(self, api_client, valid_invitation):
-        """Test accepting invitation with too short password"""
-        response = api_client.post('/api/users/invitations/accept/', {
-            'token': valid_invitation.token,
-            'password': 'short',
-            'password_confirm': 'short',
-            'first_name': 'Jane',
-            'last_name': 'Smith'
-        })
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_accept_invalid_token(self, api_client):
-        """Test accepting invitation with invalid token"""
-        response = api_client.post('/api/users/invitations/accept/', {
-            'token': 'invalid-token',
-            'password': 'password123',
-            'password_confirm': 'password123'
-        })
-
+    @pytest.mark.parametrize('invitation_state, payload, expected_statuses, expected_text', [
+        pytest.param(
+            'valid',
+            {'password': 'password123', 'password_confirm': 'different123',
+             'first_name': 'Jane', 'last_name': 'Smith'},
+            [status.HTTP_400_BAD_REQUEST],
+            ['password'],
+            id='password-mismatch'
+        ),
+        pytest.param(
+            'valid',
+            {'password': 'short', 'password_confirm': 'short',
+             'first_name': 'Jane', 'last_name': 'Smith'},
+            [status.HTTP_400_BAD_REQUEST],
+            [],
+            id='short-password'
+        ),
         # DRF serializer validates token first before other fields
-        assert response.status_code in [status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]
-
-    def test_accept_expired_invitation(self, api_client, household, landlord):
-        """Test accepting an expired invitation"""
-        invitation = TenantInvitation.objects.create(
-            email='tenant@example.com',
-            household=household,
-            invited_by=landlord
-        )
-        invitation.expires_at = timezone.now() - timedelta(days=1)
-        invitation.save()
-
-        response = api_client.post('/api/users/invitations/accept/', {
-            'token': invitation.token,
-            'password': 'password123',
-            'password_confirm': 'password123'
-        })
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        # Response may have error in different formats depending on validation order
-        assert 'error' in str(response.data).lower() or 'expired' in str(response.data).lower()
-
-    def test_accept_already_accepted_invitation(self, api_client, valid_invitation):
-        """Test accepting an already accepted invitation"""
-        valid_invitation.accept()
-
-        response = api_client.post('/api/users/invitations/accept/', {
-            'token': valid_invitation.token,
-            'password': 'password123',
-            'password_confirm': 'password123'
-        })
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        pytest.param(
+            'unknown',
+            {'password': 'password123', 'password_confirm': 'password123'},
+            [status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND],
+            [],
+            id='invalid-token'
+        ),
         # Response may have error in different formats depending on validation order
-        assert 'error' in str(response.data).lower() or 'accepted' in str(response.data).lower()
+        pytest.param(
+            'expired',
+            {'password': 'password123', 'password_confirm': 'password123'},
+            [status.HTTP_400_BAD_REQUEST],
+            ['error', 'expired'],
+            id='expired-invitation'
+        ),
+        pytest.param(
+            'accepted',
+            {'password': 'password123', 'password_confirm': 'password123'},
+            [status.HTTP_400_BAD_REQUEST],
+            ['error', 'accepted'],
+            id='already-accepted'
+        ),
+    ])
+    def test_accept_rejected(self, api_client, valid_invitation, invitation_state,
+                             payload, expected_statuses, expected_text):
+        """Test that invalid accept requests are rejected"""
+        if invitation_state == 'expired':
+            valid_invitation.expires_at = timezone.now() - timedelta(days=1)
+            valid_invitation.save()
+        elif invitation_state == 'accepted':
+            valid_invitation.accept()
+        token = 'invalid-token' if invitation_state == 'unknown' else valid_invitation.token
+
+        response = post_json(api_client, ACCEPT_URL, {'token': token, **payload})
+
+        assert response.status_code in expected_statuses
+        if expected_text:
+            body = str(response.data).lower()
+            assert any(text in body for text in expected_text)
 
     def test_accept_no_authentication_required(self, api_client, valid_invitation):
         """Test that accept endpoint doesn't require authentication"""
-        response = api_client.post('/api/users/invitations/accept/', {
+        response = post_json(api_client, ACCEPT_URL, {
             'token': valid_invitation.token,
             'password': 'password123',
             'password_confirm': 'password123'
@@ -303,7 +287,7 @@ class TestInvitationAcceptEndpoint:
 
     def test_accept_optional_phone_number(self, api_client, valid_invitation):
         """Test accepting invitation without phone number"""
-        response = api_client.post('/api/users/invitations/accept/', {
+        response = post_json(api_client, ACCEPT_URL, {
             'token': valid_invitation.token,
             'password': 'password123',
             'password_confirm': 'password123'
@@ -317,7 +301,7 @@ class TestInvitationAcceptEndpoint:
 
     def test_accept_creates_household_membership(self, api_client, valid_invitation, household, landlord):
         """Test that accepting invitation creates household membership"""
-        response = api_client.post('/api/users/invitations.accept/', {
+        response = post_json(api_client, ACCEPT_URL, {
             'token': valid_invitation.token,
             'password': 'password123',
             'password_confirm': 'password123'
@@ -332,87 +316,62 @@ class TestInvitationAcceptEndpoint:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('fast_invitation_token')
 class TestInvitationListEndpoint:
     """Test suite for invitation list endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
-
-    @pytest.fixture
-    def other_landlord(self):
-        return User.objects.create_user(
-            email='other@example.com',
-            password='testpass123',
-            role='landlord'
-        )
-
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
-        )
-
-    def test_list_invitations_unauthenticated(self, api_client):
+    @pytest.fixture(scope='class')
+    def other_landlord(self, django_db_setup, django_db_blocker):
+        with django_db_blocker.unblock():
+            other_landlord = User.objects.create_user(
+                email='other@example.com',
+                password='testpass123',
+                role='landlord'
+            )
+        yield other_landlord
+        with django_db_blocker.unblock():
+            other_landlord.delete()
+
+    @pytest.fixture(scope='class')
+    def other_household(self, other_landlord, django_db_blocker):
+        with django_db_blocker.unblock():
+            other_household = Household.objects.create(
+                name='Other Apartment',
+                address='456 Oak St',
+                landlord=other_landlord
+            )
+        yield other_household
+        with django_db_blocker.unblock():
+            other_household.delete()
+
+    def test_list_invitations_unauthenticated(self, plain_client):
         """Test that unauthenticated users cannot list invitations"""
-        response = api_client.get('/api/users/invitations/')
+        response = plain_client.get(LIST_URL)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_list_invitations_as_landlord(self, api_client, landlord, household):
+    def test_list_invitations_as_landlord(self, landlord_client, landlord, household):
         """Test that landlords can see their invitations"""
         # Create invitations
-        TenantInvitation.objects.create(
-            email='tenant1@example.com',
-            household=household,
-            invited_by=landlord
-        )
-        TenantInvitation.objects.create(
-            email='tenant2@example.com',
-            household=household,
-            invited_by=landlord
-        )
+        TenantInvitation.objects.bulk_create([
+            build_invitation('tenant1@example.com', household, landlord),
+            build_invitation('tenant2@example.com', household, landlord),
+        ])
 
-        api_client.force_authenticate(user=landlord)
-        response = api_client.get('/api/users/invitations/')
+        response = landlord_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 2
 
-    def test_list_invitations_only_own(self, api_client, landlord, other_landlord, household):
+    def test_list_invitations_only_own(self, landlord_client, landlord, other_landlord,
+                                       household, other_household):
         """Test that landlords only see their own invitations"""
-        # Create invitation by landlord
-        TenantInvitation.objects.create(
-            email='tenant1@example.com',
-            household=household,
-            invited_by=landlord
-        )
+        # Create one invitation by each landlord
+        TenantInvitation.objects.bulk_create([
+            build_invitation('tenant1@example.com', household, landlord),
+            build_invitation('tenant2@example.com', other_household, other_landlord),
+        ])
 
-        # Create household and invitation by other landlord
-        other_household = Household.objects.create(
-            name='Other Apartment',
-            address='456 Oak St',
-            landlord=other_landlord
-        )
-        TenantInvitation.objects.create(
-            email='tenant2@example.com',
-            household=other_household,
-            invited_by=other_landlord
-        )
-
-        api_client.force_authenticate(user=landlord)
-        response = api_client.get('/api/users/invitations/')
+        response = landlord_client.get(LIST_URL)
 
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 1
@@ -420,38 +379,13 @@ class TestInvitationListEndpoint:
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures('invitation_email_templates', 'fast_invitation_token')
 class TestSendInvitationEmail:
     """Test suite for send_invitation_email function"""
 
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
-
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
-        )
-
-    @pytest.fixture
-    def invitation(self, household, landlord):
-        return TenantInvitation.objects.create(
-            email='tenant@example.com',
-            household=household,
-            invited_by=landlord
-        )
-
-    def test_send_invitation_email(self, invitation):
+    def test_send_invitation_email(self, valid_invitation):
         """Test sending invitation email"""
-        send_invitation_email(invitation)
+        send_invitation_email(valid_invitation)
 
         # Check that one email was sent
         assert len(mail.outbox) == 1
@@ -460,24 +394,24 @@ class TestSendInvitationEmail:
         sent_email = mail.outbox[0]
         assert sent_email.subject == "You've been invited to join Test Apartment"
         assert 'tenant@example.com' in sent_email.to
-        assert invitation.token in sent_email.body
+        assert valid_invitation.token in sent_email.body
         assert 'Test Apartment' in sent_email.body
         assert 'John Doe' in sent_email.body
 
-    def test_email_contains_invitation_link(self, invitation):
+    def test_email_contains_invitation_link(self, valid_invitation):
         """Test that email contains the invitation acceptance link"""
-        send_invitation_email(invitation)
+        send_invitation_email(valid_invitation)
 
         sent_email = mail.outbox[0]
-        assert f'/register-invitation/{invitation.token}' in sent_email.body
+        assert f'/register-invitation/{valid_invitation.token}' in sent_email.body
 
-    def test_email_has_html_version(self, invitation):
+    def test_email_has_html_version(self, valid_invitation):
         """Test that email includes HTML version"""
-        send_invitation_email(invitation)
+        send_invitation_email(valid_invitation)
 
         sent_email = mail.outbox[0]
         # Email should have alternatives (HTML version)
         assert len(sent_email.alternatives) > 0
         html_content = sent_email.alternatives[0][0]
         assert '<html' in html_content.lower() or '<body' in html_content.lower()
-        assert invitation.token in html_content
+        assert valid_invitation.token in html_content
@@ -1,45 +1,78 @@
 import pytest
-import os
-from io import BytesIO
+from datetime import timedelta
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from rest_framework.test import APIClient
+from django.utils import timezone
 from rest_framework import status
 from users.models import Household, HouseholdMembership, TenancyAgreement
+from users.tasks import extract_tenancy_agreement
+from users.tests.conftest import EXTRACTED, FakeProvider, create_shared_user
+from users.views.onboarding import EXTRACTION_STALE_AFTER
 
 User = get_user_model()
 
+PDF_BYTES = b'%PDF-1.4 fake pdf content'
+
+@pytest.fixture(scope='session')
+def pdf_factory():
+    """Build a fresh tenancy PDF upload; each request consumes its own stream"""
+    def make():
+        return SimpleUploadedFile('tenancy.pdf', PDF_BYTES, content_type='application/pdf')
+    return make
+
+
+# The onboarding endpoints read and write the landlord's own row, so these
+# rows are shared per class only: a household left over from another class
+# would change what the status and household-creation tests see.
+@pytest.fixture(scope='class')
+def landlord(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        landlord = create_shared_user({
+            'email': 'landlord@example.com',
+            'role': 'landlord',
+            'first_name': 'John',
+            'last_name': 'Doe',
+        })
+    try:
+        yield landlord
+    finally:
+        with django_db_blocker.unblock():
+            landlord.delete()
+
+
+@pytest.fixture(scope='class')
+def tenant(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        tenant = create_shared_user({'email': 'tenant@example.com', 'role': 'tenant'})
+    try:
+        yield tenant
+    finally:
+        with django_db_blocker.unblock():
+            tenant.delete()
+
+
+@pytest.fixture(scope='class')
+def household(landlord, django_db_blocker):
+    with django_db_blocker.unblock():
+        household = Household.objects.create(
+            name='Test Apartment',
+            address='123 Main St',
+            landlord=landlord
+        )
+    try:
+        yield household
+    finally:
+        with django_db_blocker.unblock():
+            household.delete()
+
 
 @pytest.mark.django_db
 class TestOnboardingCreateHouseholdEndpoint:
     """Test suite for onboarding household creation endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
-
-    @pytest.fixture
-    def tenant(self):
-        return User.objects.create_user(
-            email='tenant@example.com',
-            password='testpass123',
-            role='tenant'
-        )
-
-    def test_create_household_success(self, api_client, landlord):
+    @pytest.mark.granular
+    def test_create_household_success(self, landlord_client, landlord):
         """Test successful household creation during onboarding"""
-        api_client.force_authenticate(user=landlord)
-
         data = {
             'name': 'Test Apartment',
             'street_address': '123 Main St',
@@ -48,11 +81,12 @@ class TestOnboardingCreateHouseholdEndpoint:
             'country': 'Netherlands'
         }
 
-        response = api_client.post('/api/users/onboarding/household/', data)
+        response = landlord_client.post('/api/users/onboarding/household/', data)
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['name'] == 'Test Apartment'
         assert 'Amsterdam' in response.data['address']
+        assert response.data['member_count'] == 0
 
         # Verify household was created
         household = Household.objects.get(name='Test Apartment')
@@ -62,55 +96,18 @@ class TestOnboardingCreateHouseholdEndpoint:
         landlord.refresh_from_db()
         assert landlord.onboarding_step >= 1
 
-    def test_create_household_with_full_address(self, api_client, landlord):
+    def test_create_household_with_full_address(self, landlord_client):
         """Test creating household with single address field"""
-        api_client.force_authenticate(user=landlord)
-
         data = {
             'name': 'Test Apartment',
             'address': '123 Main St, Amsterdam, 1012 AB, Netherlands'
         }
 
-        response = api_client.post('/api/users/onboarding/household/', data)
+        response = landlord_client.post('/api/users/onboarding/household/', data)
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['address'] == '123 Main St, Amsterdam, 1012 AB, Netherlands'
 
-    def test_create_household_missing_name(self, api_client, landlord):
-        """Test creating household without name fails"""
-        api_client.force_authenticate(user=landlord)
-
-        data = {
-            'address': '123 Main St'
-        }
-
-        response = api_client.post('/api/users/onboarding/household/', data)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_create_household_missing_address(self, api_client, landlord):
-        """Test creating household without address fails"""
-        api_client.force_authenticate(user=landlord)
-
-        data = {
-            'name': 'Test Apartment'
-        }
-
-        response = api_client.post('/api/users/onboarding/household/', data)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_create_household_unauthenticated(self, api_client):
-        """Test creating household without authentication fails"""
-        data = {
-            'name': 'Test Apartment',
-            'address': '123 Main St'
-        }
-
-        response = api_client.post('/api/users/onboarding/household/', data)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_create_household_as_tenant(self, api_client, tenant):
         """Test that tenants cannot create households"""
         api_client.force_authenticate(user=tenant)
@@ -129,31 +126,16 @@ class TestOnboardingCreateHouseholdEndpoint:
 class TestOnboardingUpdateLandlordEndpoint:
     """Test suite for onboarding landlord update endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
-
-    def test_update_landlord_info(self, api_client, landlord):
+    @pytest.mark.granular
+    def test_update_landlord_info(self, landlord_client, landlord):
         """Test updating landlord information"""
-        api_client.force_authenticate(user=landlord)
-
         data = {
             'first_name': 'Jane',
             'last_name': 'Smith',
             'phone_number': '+31612345678'
         }
 
-        response = api_client.patch('/api/users/onboarding/landlord/', data)
+        response = landlord_client.patch('/api/users/onboarding/landlord/', data)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['first_name'] == 'Jane'
@@ -169,81 +151,32 @@ class TestOnboardingUpdateLandlordEndpoint:
         # Verify onboarding step was updated
         assert landlord.onboarding_step >= 2
 
-    def test_update_landlord_partial(self, api_client, landlord):
+    def test_update_landlord_partial(self, landlord_client):
         """Test partial update of landlord info"""
-        api_client.force_authenticate(user=landlord)
-
         data = {
             'first_name': 'Jane'
         }
 
-        response = api_client.patch('/api/users/onboarding/landlord/', data)
+        response = landlord_client.patch('/api/users/onboarding/landlord/', data)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['first_name'] == 'Jane'
         assert response.data['last_name'] == 'Doe'  # Unchanged
 
-    def test_update_landlord_invalid_phone(self, api_client, landlord):
-        """Test updating with invalid phone number"""
-        api_client.force_authenticate(user=landlord)
-
-        data = {
-            'phone_number': 'invalid-phone'
-        }
-
-        response = api_client.patch('/api/users/onboarding/landlord/', data)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_update_landlord_unauthenticated(self, api_client):
-        """Test updating without authentication fails"""
-        data = {
-            'first_name': 'Jane'
-        }
-
-        response = api_client.patch('/api/users/onboarding/landlord/', data)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
 
 @pytest.mark.django_db
 class TestOnboardingTenancyUploadEndpoint:
     """Test suite for onboarding tenancy agreement upload endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord'
-        )
-
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
-        )
-
-    def test_upload_tenancy_pdf(self, api_client, landlord, household):
+    @pytest.mark.granular
+    def test_upload_tenancy_pdf(self, landlord_client, household, pdf_factory):
         """Test uploading a PDF tenancy agreement"""
-        api_client.force_authenticate(user=landlord)
-
-        # Create a simple PDF file mock
-        pdf_content = b'%PDF-1.4 fake pdf content'
-        pdf_file = SimpleUploadedFile('tenancy.pdf', pdf_content, content_type='application/pdf')
-
         data = {
             'household_id': household.id,
-            'file': pdf_file
+            'file': pdf_factory()
         }
 
-        response = api_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
 
         assert response.status_code == status.HTTP_201_CREATED
         assert 'file' in response.data
@@ -254,37 +187,29 @@ class TestOnboardingTenancyUploadEndpoint:
         assert agreement.file_name == 'tenancy.pdf'
         assert agreement.status == 'pending'
 
-    def test_upload_tenancy_missing_file(self, api_client, landlord, household):
+    def test_upload_tenancy_missing_file(self, landlord_client, household):
         """Test uploading without file fails"""
-        api_client.force_authenticate(user=landlord)
-
         data = {
             'household_id': household.id
         }
 
-        response = api_client.post('/api/users/onboarding/tenancy/upload/', data)
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', data)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'file' in response.data['error'].lower()
 
-    def test_upload_tenancy_missing_household(self, api_client, landlord):
+    def test_upload_tenancy_missing_household(self, landlord_client, pdf_factory):
         """Test uploading without household_id fails"""
-        api_client.force_authenticate(user=landlord)
-
-        pdf_file = SimpleUploadedFile('tenancy.pdf', b'pdf content', content_type='application/pdf')
-
         data = {
-            'file': pdf_file
+            'file': pdf_factory()
         }
 
-        response = api_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_upload_tenancy_wrong_household(self, api_client, landlord):
+    def test_upload_tenancy_wrong_household(self, landlord_client, pdf_factory):
         """Test uploading to another landlord's household fails"""
-        api_client.force_authenticate(user=landlord)
-
         other_landlord = User.objects.create_user(
             email='other@example.com',
             password='testpass123',
@@ -296,21 +221,17 @@ class TestOnboardingTenancyUploadEndpoint:
             landlord=other_landlord
         )
 
-        pdf_file = SimpleUploadedFile('tenancy.pdf', b'pdf content', content_type='application/pdf')
-
         data = {
             'household_id': other_household.id,
-            'file': pdf_file
+            'file': pdf_factory()
         }
 
-        response = api_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_upload_tenancy_invalid_file_type(self, api_client, landlord, household):
+    def test_upload_tenancy_invalid_file_type(self, landlord_client, household):
         """Test uploading invalid file type fails"""
-        api_client.force_authenticate(user=landlord)
-
         exe_file = SimpleUploadedFile('virus.exe', b'malicious content', content_type='application/x-msdownload')
 
         data = {
@@ -318,40 +239,95 @@ class TestOnboardingTenancyUploadEndpoint:
             'file': exe_file
         }
 
-        response = api_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', data, format='multipart')
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'type not supported' in response.data['error'].lower()
 
+    def test_upload_tenancy_queues_extraction(self, landlord_client, household, pdf_factory, monkeypatch):
+        """Test that the upload hands the new agreement to the background extraction"""
+        queued = []
+        monkeypatch.setattr(
+            'users.views.onboarding.run_after_commit',
+            lambda func, *args: queued.append((func, args))
+        )
+
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', {
+            'household_id': household.id,
+            'file': pdf_factory()
+        }, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert queued == [(extract_tenancy_agreement, (response.data['id'],))]
+
+    def test_upload_tenancy_registers_on_commit_callback(
+        self, landlord_client, household, pdf_factory, django_capture_on_commit_callbacks
+    ):
+        """Test that the extraction waits for the upload's transaction to commit"""
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = landlord_client.post('/api/users/onboarding/tenancy/upload/', {
+                'household_id': household.id,
+                'file': pdf_factory()
+            }, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(callbacks) == 1
+
 
 @pytest.mark.django_db
-class TestOnboardingAddTenantEndpoint:
-    """Test suite for onboarding add tenant endpoint"""
+class TestOnboardingTenancyProcessEndpoint:
+    """Test suite for polling and (re)processing a tenancy agreement"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
+    def test_get_agreement(self, landlord_client, agreement):
+        """Test that the landlord can poll the agreement's status"""
+        response = landlord_client.get(f'/api/users/onboarding/{agreement.id}/agreement/')
 
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord'
-        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['id'] == agreement.id
+        assert response.data['status'] == 'pending'
 
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
+    def test_process_while_extraction_runs(self, landlord_client, agreement):
+        """Test that processing a fresh pending agreement conflicts with the background run"""
+        response = landlord_client.post(f'/api/users/onboarding/{agreement.id}/process/')
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        agreement.refresh_from_db()
+        assert agreement.status == 'pending'
+
+    def test_process_already_processed(self, landlord_client, agreement):
+        """Test that a processed agreement is returned with its extracted data"""
+        agreement.status = 'processed'
+        agreement.extracted_data = EXTRACTED
+        agreement.save()
+
+        response = landlord_client.post(f'/api/users/onboarding/{agreement.id}/process/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['extracted_data'] == EXTRACTED
+
+    @pytest.mark.parametrize('stuck_status', ['pending', 'processing'])
+    def test_process_recovers_stale_agreement(self, landlord_client, agreement, stuck_status, monkeypatch):
+        """Test that an agreement abandoned by its background thread can be processed"""
+        monkeypatch.setattr('users.views.onboarding.get_extraction_provider', FakeProvider)
+        TenancyAgreement.objects.filter(pk=agreement.pk).update(
+            status=stuck_status,
+            uploaded_at=timezone.now() - EXTRACTION_STALE_AFTER - timedelta(minutes=1)
         )
 
-    def test_add_tenant_manually(self, api_client, landlord, household):
-        """Test manually adding a tenant"""
-        api_client.force_authenticate(user=landlord)
+        response = landlord_client.post(f'/api/users/onboarding/{agreement.id}/process/')
 
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['status'] == 'processed'
+        assert response.data['extracted_data'] == EXTRACTED
+
+
+@pytest.mark.django_db
+class TestOnboardingAddTenantEndpoint:
+    """Test suite for onboarding add tenant endpoint"""
+
+    @pytest.mark.granular
+    def test_add_tenant_manually(self, landlord_client, household):
+        """Test manually adding a tenant"""
         data = {
             'household_id': household.id,
             'first_name': 'Jane',
@@ -360,7 +336,7 @@ class TestOnboardingAddTenantEndpoint:
             'phone_number': '+31612345678'
         }
 
-        response = api_client.post('/api/users/onboarding/tenant/add/', data)
+        response = landlord_client.post('/api/users/onboarding/tenant/add/', data)
 
         assert response.status_code == status.HTTP_201_CREATED
 
@@ -370,59 +346,17 @@ class TestOnboardingAddTenantEndpoint:
         assert membership.tenant.first_name == 'Jane'
         assert membership.tenant.last_name == 'Smith'
 
-    def test_add_tenant_missing_email(self, api_client, landlord, household):
-        """Test adding tenant without email fails"""
-        api_client.force_authenticate(user=landlord)
-
-        data = {
-            'household_id': household.id,
-            'first_name': 'Jane',
-            'last_name': 'Smith'
-        }
-
-        response = api_client.post('/api/users/onboarding/tenant/add/', data)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_add_tenant_invalid_email(self, api_client, landlord, household):
-        """Test adding tenant with invalid email fails"""
-        api_client.force_authenticate(user=landlord)
-
-        data = {
-            'household_id': household.id,
-            'first_name': 'Jane',
-            'last_name': 'Smith',
-            'email': 'invalid-email'
-        }
-
-        response = api_client.post('/api/users/onboarding/tenant/add/', data)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
 
 @pytest.mark.django_db
 class TestOnboardingCompleteEndpoint:
     """Test suite for onboarding complete endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord'
-        )
-
-    def test_complete_onboarding(self, api_client, landlord):
+    @pytest.mark.granular
+    def test_complete_onboarding(self, landlord_client, landlord):
         """Test completing onboarding"""
-        api_client.force_authenticate(user=landlord)
-
         assert landlord.is_onboarded is False
 
-        response = api_client.post('/api/users/onboarding/complete/', {})
+        response = landlord_client.post('/api/users/onboarding/complete/', {})
 
         assert response.status_code == status.HTTP_200_OK
 
@@ -430,44 +364,16 @@ class TestOnboardingCompleteEndpoint:
         landlord.refresh_from_db()
         assert landlord.is_onboarded is True
 
-    def test_complete_onboarding_unauthenticated(self, api_client):
-        """Test completing onboarding without authentication fails"""
-        response = api_client.post('/api/users/onboarding/complete/', {})
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
 
 @pytest.mark.django_db
 class TestOnboardingStatusEndpoint:
     """Test suite for onboarding status endpoint"""
 
-    @pytest.fixture
-    def api_client(self):
-        return APIClient()
-
-    @pytest.fixture
-    def landlord(self):
-        return User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            role='landlord',
-            first_name='John',
-            last_name='Doe'
-        )
-
-    @pytest.fixture
-    def household(self, landlord):
-        return Household.objects.create(
-            name='Test Apartment',
-            address='123 Main St',
-            landlord=landlord
-        )
-
-    def test_get_onboarding_status_new_user(self, api_client, landlord):
+    def test_get_onboarding_status_new_user(self, landlord_client, django_assert_num_queries):
         """Test getting onboarding status for new user"""
-        api_client.force_authenticate(user=landlord)
-
-        response = api_client.get('/api/users/onboarding/status/')
+        # Household and tenant EXISTS checks share one query, however many rows there are
+        with django_assert_num_queries(1):
+            response = landlord_client.get('/api/users/onboarding/status/')
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['is_onboarded'] is False
@@ -476,43 +382,174 @@ class TestOnboardingStatusEndpoint:
         assert response.data['landlord_info_complete'] is False
         assert response.data['tenants_added'] is False
 
-    def test_get_onboarding_status_with_household(self, api_client, landlord, household):
-        """Test getting onboarding status with household created"""
-        api_client.force_authenticate(user=landlord)
+    def test_get_onboarding_status_refreshes_after_household_created(self, landlord_client, landlord):
+        """Test a cached status is invalidated when the landlord creates a household"""
+        response = landlord_client.get('/api/users/onboarding/status/')
+        assert response.data['household_created'] is False
 
-        response = api_client.get('/api/users/onboarding/status/')
+        Household.objects.create(name='New Apartment', address='1 New St', landlord=landlord)
+
+        response = landlord_client.get('/api/users/onboarding/status/')
+        assert response.data['household_created'] is True
+
+    def test_get_onboarding_status_with_household(self, landlord_client, household,
+                                                  django_assert_num_queries):
+        """Test getting onboarding status with household created"""
+        with django_assert_num_queries(1):
+            response = landlord_client.get('/api/users/onboarding/status/')
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['household_created'] is True
 
-    def test_get_onboarding_status_with_info(self, api_client, landlord):
+    def test_get_onboarding_status_with_info(self, landlord_client, landlord, django_assert_num_queries):
         """Test getting onboarding status with complete landlord info"""
         landlord.first_name = 'John'
         landlord.last_name = 'Doe'
         landlord.phone_number = '+31612345678'
         landlord.save()
 
-        api_client.force_authenticate(user=landlord)
-
-        response = api_client.get('/api/users/onboarding/status/')
+        with django_assert_num_queries(1):
+            response = landlord_client.get('/api/users/onboarding/status/')
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['landlord_info_complete'] is True
 
-    def test_get_onboarding_status_completed(self, api_client, landlord):
+    def test_get_onboarding_status_completed(self, landlord_client, landlord):
         """Test getting onboarding status for completed onboarding"""
         landlord.is_onboarded = True
         landlord.save()
 
-        api_client.force_authenticate(user=landlord)
-
-        response = api_client.get('/api/users/onboarding/status/')
+        response = landlord_client.get('/api/users/onboarding/status/')
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['is_onboarded'] is True
 
+
+# No django_db marker: these requests are rejected during authentication,
+# before any query runs, so they need no transaction around them.
+class TestOnboardingUnauthenticated:
+    """Test that onboarding endpoints require authentication"""
+
+    def test_create_household_unauthenticated(self, api_client):
+        """Test creating household without authentication fails"""
+        data = {
+            'name': 'Test Apartment',
+            'address': '123 Main St'
+        }
+
+        response = api_client.post('/api/users/onboarding/household/', data)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_update_landlord_unauthenticated(self, api_client):
+        """Test updating without authentication fails"""
+        data = {
+            'first_name': 'Jane'
+        }
+
+        response = api_client.patch('/api/users/onboarding/landlord/', data)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_complete_onboarding_unauthenticated(self, api_client):
+        """Test completing onboarding without authentication fails"""
+        response = api_client.post('/api/users/onboarding/complete/', {})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
     def test_get_onboarding_status_unauthenticated(self, api_client):
         """Test getting onboarding status without authentication fails"""
         response = api_client.get('/api/users/onboarding/status/')
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestOnboardingValidationErrors:
+    """Test that onboarding endpoints reject invalid payloads"""
+
+    @pytest.mark.parametrize('method, url, build_payload', [
+        pytest.param(
+            'post', '/api/users/onboarding/household/',
+            lambda household: {'address': '123 Main St'},
+            id='household-missing-name'
+        ),
+        pytest.param(
+            'post', '/api/users/onboarding/household/',
+            lambda household: {'name': 'Test Apartment'},
+            id='household-missing-address'
+        ),
+        pytest.param(
+            'patch', '/api/users/onboarding/landlord/',
+            lambda household: {'phone_number': 'invalid-phone'},
+            id='landlord-invalid-phone'
+        ),
+        pytest.param(
+            'post', '/api/users/onboarding/tenant/add/',
+            lambda household: {'household_id': household.id, 'first_name': 'Jane', 'last_name': 'Smith'},
+            id='tenant-missing-email'
+        ),
+        pytest.param(
+            'post', '/api/users/onboarding/tenant/add/',
+            lambda household: {
+                'household_id': household.id,
+                'first_name': 'Jane',
+                'last_name': 'Smith',
+                'email': 'invalid-email'
+            },
+            id='tenant-invalid-email'
+        ),
+    ])
+    def test_invalid_payload_rejected(self, landlord_client, household, method, url, build_payload):
+        """Test an invalid payload returns 400"""
+        response = getattr(landlord_client, method)(url, build_payload(household))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestOnboardingFullFlow:
+    """Test the whole landlord onboarding happy path as one user"""
+
+    def test_full_onboarding_flow(self, landlord_client, landlord, pdf_factory):
+        """Test household, landlord info, upload, tenant and completion in order"""
+        response = landlord_client.post('/api/users/onboarding/household/', {
+            'name': 'Test Apartment',
+            'address': '123 Main St, Amsterdam, 1012 AB, Netherlands'
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        household_id = response.data['id']
+
+        response = landlord_client.patch('/api/users/onboarding/landlord/', {
+            'first_name': 'Jane',
+            'last_name': 'Smith',
+            'phone_number': '+31612345678'
+        })
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['phone_number'] == '+31612345678'
+
+        response = landlord_client.post('/api/users/onboarding/tenancy/upload/', {
+            'household_id': household_id,
+            'file': pdf_factory()
+        }, format='multipart')
+        assert response.status_code == status.HTTP_201_CREATED
+        assert 'file' in response.data
+
+        response = landlord_client.post('/api/users/onboarding/tenant/add/', {
+            'household_id': household_id,
+            'first_name': 'Tom',
+            'last_name': 'Tenant',
+            'email': 'newtenant@example.com'
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        assert HouseholdMembership.objects.filter(
+            household_id=household_id,
+            tenant__email='newtenant@example.com'
+        ).exists()
+
+        response = landlord_client.post('/api/users/onboarding/complete/', {})
+        assert response.status_code == status.HTTP_200_OK
+
+        landlord.refresh_from_db()
+        assert landlord.is_onboarded is True
+        assert landlord.first_name == 'Jane'
@@ -8,10 +8,27 @@ import pytest
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.test import APIClient
+from users.models import Tenancy
 
 User = get_user_model()
 
 
+@pytest.fixture(params=['tenant', 'landlord', 'admin_user'])
+def role_user(request):
+    """One user per role, reusing the shared tenant, landlord and admin fixtures."""
+    return request.getfixturevalue(request.param)
+
+
+class TestProfileViewUnauthenticated:
+    """Test cases for the profile view without credentials (no database needed)."""
+
+    def test_get_profile_unauthenticated(self, api_client):
+        """Test unauthenticated user cannot access profile."""
+        response = api_client.get('/api/users/me/')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 @pytest.mark.django_db
 class TestProfileView:
     """Test cases for the profile view endpoint."""
@@ -27,12 +44,6 @@ class TestProfileView:
         assert 'id' in response.data
         assert 'role' in response.data
 
-    def test_get_profile_unauthenticated(self, api_client):
-        """Test unauthenticated user cannot access profile."""
-        response = api_client.get('/api/users/me/')
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_update_profile_basic_fields(self, authenticated_client, user):
         """Test user can update their basic profile fields."""
         update_data = {
@@ -66,6 +77,18 @@ class TestProfileView:
         # Last name should remain unchanged
         assert response.data['last_name'] == user.last_name
 
+    def test_update_profile_invalidates_tenancy_lists(
+        self, authenticated_client, user, django_capture_on_commit_callbacks
+    ):
+        """Test that a name change retires cached tenancy lists showing it."""
+        before = Tenancy.list_cache_key(user.pk, '')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.patch('/api/users/me/', {'first_name': 'Renamed'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert Tenancy.list_cache_key(user.pk, '') != before
+
     def test_cannot_update_email(self, authenticated_client, user):
         """Test user cannot change their email address."""
         original_email = user.email
@@ -104,49 +127,15 @@ class TestProfileView:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_tenant_can_view_own_profile(self, api_client, db):
-        """Test tenant role can view their own profile."""
-        tenant = User.objects.create_user(
-            email='tenant@example.com',
-            password='testpass123',
-            first_name='Tenant',
-            last_name='User',
-            role='tenant'
-        )
-        api_client.force_authenticate(user=tenant)
+    def test_role_can_view_own_profile(self, api_client, role_user):
+        """Test every role can view their own profile."""
+        api_client.force_authenticate(user=role_user)
 
         response = api_client.get('/api/users/me/')
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['email'] == tenant.email
-        assert response.data['role'] == 'tenant'
-
-    def test_landlord_can_view_own_profile(self, api_client, db):
-        """Test landlord role can view their own profile."""
-        landlord = User.objects.create_user(
-            email='landlord@example.com',
-            password='testpass123',
-            first_name='Landlord',
-            last_name='User',
-            role='landlord'
-        )
-        api_client.force_authenticate(user=landlord)
-
-        response = api_client.get('/api/users/me/')
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data['email'] == landlord.email
-        assert response.data['role'] == 'landlord'
-
-    def test_admin_can_view_own_profile(self, authenticated_client, admin_user, api_client):
-        """Test admin role can view their own profile."""
-        api_client.force_authenticate(user=admin_user)
-
-        response = api_client.get('/api/users/me/')
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data['email'] == admin_user.email
-        assert response.data['role'] == 'admin'
+        assert response.data['email'] == role_user.email
+        assert response.data['role'] == role_user.role
 
     def test_user_cannot_change_own_role(self, authenticated_client, user):
         """Test user cannot change their own role."""
@@ -182,27 +171,17 @@ class TestProfileView:
         assert 'password' not in response.data
 
     def test_multiple_profile_updates(self, authenticated_client, user):
-        """Test multiple sequential profile updates work correctly."""
-        # First update
-        response1 = authenticated_client.patch('/api/users/me/', {
-            'first_name': 'First'
-        })
-        assert response1.status_code == status.HTTP_200_OK
-        assert response1.data['first_name'] == 'First'
-
-        # Second update
-        response2 = authenticated_client.patch('/api/users/me/', {
-            'last_name': 'Last'
-        })
-        assert response2.status_code == status.HTTP_200_OK
-        assert response2.data['first_name'] == 'First'  # Should persist
-        assert response2.data['last_name'] == 'Last'
-
-        # Third update
-        response3 = authenticated_client.patch('/api/users/me/', {
+        """Test a combined profile update persists every field."""
+        response = authenticated_client.patch('/api/users/me/', {
+            'first_name': 'First',
+            'last_name': 'Last',
             'phone_number': '+31612345678'
         })
-        assert response3.status_code == status.HTTP_200_OK
-        assert response3.data['first_name'] == 'First'  # Should persist
-        assert response3.data['last_name'] == 'Last'  # Should persist
-        assert response3.data['phone_number'] == '+31612345678'
+        assert response.status_code == status.HTTP_200_OK
+
+        # Read back through the endpoint to confirm the values were stored
+        response = authenticated_client.get('/api/users/me/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['first_name'] == 'First'
+        assert response.data['last_name'] == 'Last'
+        assert response.data['phone_number'] == '+31612345678'
@@ -94,17 +94,16 @@ class TestLandlordUpdateSchema:
         with pytest.raises(ValidationError):
             LandlordUpdateSchema(phone_number='invalid')
 
-    def test_landlord_valid_phone_formats(self):
+    @pytest.mark.parametrize('phone', [
+        '+31612345678',
+        '31612345678',
+        '0612345678',
+        '+1234567890'
+    ])
+    def test_landlord_valid_phone_formats(self, phone):
         """Test various valid phone number formats"""
-        valid_phones = [
-            '+31612345678',
-            '31612345678',
-            '0612345678',
-            '+1234567890'
-        ]
-        for phone in valid_phones:
-            schema = LandlordUpdateSchema(phone_number=phone)
-            assert schema.phone_number == phone
+        schema = LandlordUpdateSchema(phone_number=phone)
+        assert schema.phone_number == phone
 
 
 class TestTenancyUploadSchema:
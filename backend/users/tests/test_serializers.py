@@ -0,0 +1,53 @@
+from rest_framework import serializers
+from users.models import User
+from users.serializers import LandlordSerializer, RenterUserSerializer
+
+
+class PlainRenterUserSerializer(serializers.ModelSerializer):
+    """Reference serializer using DRF's regular field dispatch"""
+
+    class Meta:
+        model = User
+        fields = RenterUserSerializer.Meta.fields
+
+
+class TestFlatRepresentationSerializers:
+    """Test suite for serializers using FlatRepresentationMixin"""
+
+    def test_matches_field_based_representation(self):
+        """Test flat output is identical to DRF's per-field output"""
+        user = User(
+            id=7,
+            email='jane@example.com',
+            first_name='Jane',
+            last_name='Smith',
+            phone_number='+31612345678'
+        )
+
+        assert RenterUserSerializer(user).data == PlainRenterUserSerializer(user).data
+
+    def test_null_phone_number(self):
+        """Test nullable columns are rendered as None"""
+        user = User(id=7, email='jane@example.com', phone_number=None)
+
+        data = LandlordSerializer(user).data
+
+        assert data == {
+            'id': 7,
+            'email': 'jane@example.com',
+            'first_name': '',
+            'last_name': '',
+            'phone_number': None,
+        }
+
+    def test_many(self):
+        """Test list serialization goes through the flat path for each item"""
+        users = [
+            User(id=1, email='a@example.com', first_name='A'),
+            User(id=2, email='b@example.com', first_name='B'),
+        ]
+
+        data = RenterUserSerializer(users, many=True).data
+
+        assert [item['email'] for item in data] == ['a@example.com', 'b@example.com']
+        assert list(data[0].keys()) == list(RenterUserSerializer.Meta.fields)
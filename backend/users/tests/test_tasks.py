@@ -0,0 +1,83 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from users.models import TenancyAgreement
+from users.tasks import extract_tenancy_agreement, run_after_commit, welcome_new_tenant
+from users.tests.conftest import EXTRACTED, FakeProvider
+
+User = get_user_model()
+
+
+class FailingProvider:
+    """Stand-in for GeminiProvider whose extraction errors"""
+
+    def extract_tenant_data(self, file_path):
+        raise RuntimeError('quota exceeded')
+
+
+@pytest.mark.django_db
+class TestExtractTenancyAgreement:
+    """Test suite for the background tenancy agreement extraction"""
+
+    def test_extraction_stores_data(self, agreement, monkeypatch):
+        """Test that a successful extraction marks the agreement processed"""
+        monkeypatch.setattr('users.tasks.get_extraction_provider', FakeProvider)
+
+        extract_tenancy_agreement(agreement.id)
+
+        agreement.refresh_from_db()
+        assert agreement.status == 'processed'
+        assert agreement.extracted_data == EXTRACTED
+
+    def test_extraction_failure_marks_failed(self, agreement, monkeypatch):
+        """Test that a provider error marks the agreement failed"""
+        monkeypatch.setattr('users.tasks.get_extraction_provider', FailingProvider)
+
+        extract_tenancy_agreement(agreement.id)
+
+        agreement.refresh_from_db()
+        assert agreement.status == 'failed'
+        assert agreement.extracted_data is None
+
+    def test_extraction_skips_claimed_agreement(self, agreement, monkeypatch):
+        """Test that an agreement the process endpoint already claimed is left alone"""
+        monkeypatch.setattr('users.tasks.get_extraction_provider', FakeProvider)
+        TenancyAgreement.objects.filter(pk=agreement.pk).update(status='processing')
+
+        extract_tenancy_agreement(agreement.id)
+
+        agreement.refresh_from_db()
+        assert agreement.status == 'processing'
+        assert agreement.extracted_data is None
+
+
+@pytest.mark.django_db
+class TestWelcomeNewTenant:
+    """Test suite for setting a new tenant's password and welcoming them"""
+
+    def test_sets_password_and_sends_email(self):
+        """Test that the temporary password is set and emailed"""
+        tenant = User.objects.create_user(email='new@example.com', role='tenant')
+        assert not tenant.has_usable_password()
+
+        welcome_new_tenant(tenant, 'temp-pass-123', 'John Doe')
+
+        tenant.refresh_from_db()
+        assert tenant.check_password('temp-pass-123')
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ['new@example.com']
+
+
+@pytest.mark.django_db
+class TestRunAfterCommit:
+    """Test suite for run_after_commit"""
+
+    def test_waits_for_commit(self, django_capture_on_commit_callbacks):
+        """Test that nothing runs until the transaction commits"""
+        calls = []
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            run_after_commit(calls.append, 'ran')
+
+        assert len(callbacks) == 1
+        assert calls == []
@@ -0,0 +1,444 @@
+import threading
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import Household, Renter, Tenancy, TenantInvitation
+
+User = get_user_model()
+
+TENANCIES_URL = '/api/users/tenancies/'
+
+# (HTTP method, detail path, denied action) for each landlord-only tenancy action
+LANDLORD_ACTIONS = [
+    ('patch', '', 'update this tenancy'),
+    ('delete', '', 'delete this tenancy'),
+    ('post', 'add_renter/', 'add renters to this tenancy'),
+    ('delete', 'renters/1/', 'remove renters from this tenancy'),
+    ('post', 'activate/', 'activate this tenancy'),
+    ('post', 'start_moveout/', 'start move-out for this tenancy'),
+    ('post', 'mark_moved_out/', 'mark this tenancy as moved out'),
+    ('post', 'upload_proof/', 'upload proof for this tenancy'),
+    ('post', 'upload_inventory_report/', 'upload inventory report for this tenancy'),
+    ('post', 'upload_checkout_reading/', 'upload checkout reading for this tenancy'),
+]
+
+
+class JoinedThread(threading.Thread):
+    """Thread whose start() waits for it to finish"""
+
+    def start(self):
+        super().start()
+        self.join()
+
+
+@pytest.fixture
+def inline_background_tasks(monkeypatch):
+    """Finish run_after_commit's threads before the commit returns, so tests can assert on them"""
+    monkeypatch.setattr('users.tasks.threading', SimpleNamespace(Thread=JoinedThread))
+
+
+@pytest.fixture
+def tenancy(household):
+    return Tenancy.objects.create(household=household, start_date=date(2025, 1, 1), monthly_rent=1000)
+
+
+@pytest.fixture
+def tenant_client(tenant):
+    client = APIClient()
+    client.force_authenticate(user=tenant)
+    return client
+
+
+@pytest.mark.django_db
+class TestTenancyCreate:
+    """Test suite for creating a tenancy with its initial renters"""
+
+    def create(self, client, household, renters):
+        return client.post(TENANCIES_URL, {
+            'household_id': household.id,
+            'start_date': '2025-01-01',
+            'monthly_rent': '1200.00',
+            'renters': renters,
+        }, format='json')
+
+    def test_create_with_existing_and_new_renters(self, landlord_client, household, tenant):
+        """Test that existing users are reused and new ones are created inactive"""
+        response = self.create(landlord_client, household, [
+            {'email': tenant.email},
+            {'email': 'nora@example.com', 'first_name': 'Nora', 'last_name': 'Visser'},
+        ])
+
+        assert response.status_code == status.HTTP_201_CREATED
+        renters = Renter.objects.filter(tenancy_id=response.data['data']['id']).select_related('user')
+        users = {renter.user.email: renter.user for renter in renters}
+        assert set(users) == {tenant.email, 'nora@example.com'}
+        assert users[tenant.email].pk == tenant.pk
+        assert users[tenant.email].is_active
+
+        new_user = users['nora@example.com']
+        assert not new_user.is_active
+        assert new_user.role == 'tenant'
+        assert new_user.get_full_name() == 'Nora Visser'
+
+    def test_create_keeps_last_primary_renter(self, landlord_client, household, tenant):
+        """Test that only the last renter marked primary stays primary"""
+        response = self.create(landlord_client, household, [
+            {'email': tenant.email, 'is_primary': True},
+            {'email': 'nora@example.com', 'is_primary': True},
+            {'email': 'sam@example.com'},
+        ])
+
+        assert response.status_code == status.HTTP_201_CREATED
+        primaries = Renter.objects.filter(tenancy_id=response.data['data']['id'], is_primary=True)
+        assert [renter.user.email for renter in primaries] == ['nora@example.com']
+        assert response.data['data']['primary_renter']['email'] == 'nora@example.com'
+
+    def test_create_invites_new_renters(self, landlord_client, household, landlord, tenant):
+        """Test that each new user gets an invitation with a token and expiry"""
+        response = self.create(landlord_client, household, [
+            {'email': tenant.email},
+            {'email': 'nora@example.com'},
+            {'email': 'sam@example.com'},
+        ])
+
+        assert response.status_code == status.HTTP_201_CREATED
+        invitations = TenantInvitation.objects.filter(household=household)
+        assert {invitation.email for invitation in invitations} == {'nora@example.com', 'sam@example.com'}
+        for invitation in invitations:
+            assert invitation.token
+            assert invitation.expires_at is not None
+            assert invitation.invited_by_id == landlord.id
+        assert len({invitation.token for invitation in invitations}) == 2
+
+    @pytest.mark.usefixtures('inline_background_tasks')
+    def test_create_emails_invitations_on_commit(
+        self, landlord_client, household, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test that invitation emails go out once the tenancy commits, to new users only"""
+        with django_capture_on_commit_callbacks(execute=True):
+            response = self.create(landlord_client, household, [
+                {'email': tenant.email},
+                {'email': 'nora@example.com'},
+            ])
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ['nora@example.com']
+        invitation = TenantInvitation.objects.get(email='nora@example.com')
+        assert invitation.token in mail.outbox[0].body
+
+    def test_create_rejects_duplicate_renter_emails(self, landlord_client, household):
+        """Test that the same email twice in one request is a 400"""
+        response = self.create(landlord_client, household, [
+            {'email': 'nora@example.com'},
+            {'email': 'nora@example.com', 'is_primary': True},
+        ])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'already a renter' in response.data['error']
+
+
+@pytest.mark.django_db
+class TestTenancyListCaching:
+    """Test suite for the cached tenancy list responses"""
+
+    def test_list_served_from_cache(self, landlord_client, tenancy):
+        """Test that a write that invalidates nothing still sees the cached page"""
+        landlord_client.get(TENANCIES_URL)
+        Tenancy.objects.filter(pk=tenancy.pk).update(monthly_rent=2000)
+
+        response = landlord_client.get(TENANCIES_URL)
+
+        assert response.data['results'][0]['monthly_rent'] == '1000.00'
+
+    def test_list_shows_added_renter(
+        self, landlord_client, tenancy, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test that adding a renter retires the cached page once it commits"""
+        assert landlord_client.get(TENANCIES_URL).data['results'][0]['renter_count'] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            landlord_client.post(f'{TENANCIES_URL}{tenancy.id}/add_renter/', {
+                'email': tenant.email,
+                'is_primary': True,
+            }, format='json')
+
+        result = landlord_client.get(TENANCIES_URL).data['results'][0]
+        assert result['renter_count'] == 1
+        assert result['primary_renter']['email'] == tenant.email
+
+    def test_list_shows_renamed_household(
+        self, landlord_client, household, tenancy, django_capture_on_commit_callbacks
+    ):
+        """Test that renaming the household retires the cached page once it commits"""
+        assert landlord_client.get(TENANCIES_URL).data['results'][0]['household_name'] == household.name
+
+        with django_capture_on_commit_callbacks(execute=True):
+            landlord_client.patch(
+                f'/api/users/households/{household.id}/', {'name': 'Canal House'}, format='json'
+            )
+
+        assert landlord_client.get(TENANCIES_URL).data['results'][0]['household_name'] == 'Canal House'
+
+    def test_list_shows_renamed_renter(
+        self, landlord_client, tenant_client, tenancy, tenant, django_capture_on_commit_callbacks
+    ):
+        """Test that a renter changing their name retires the cached page once it commits"""
+        Renter.objects.create(tenancy=tenancy, user=tenant, is_primary=True)
+        first = landlord_client.get(TENANCIES_URL).data['results'][0]
+        assert first['primary_renter']['name'] == 'Jane Smith'
+
+        with django_capture_on_commit_callbacks(execute=True):
+            tenant_client.patch('/api/users/me/', {'first_name': 'Janet'}, format='json')
+
+        second = landlord_client.get(TENANCIES_URL).data['results'][0]
+        assert second['primary_renter']['name'] == 'Janet Smith'
+
+    def test_list_uncached_when_disabled(self, landlord, landlord_client, tenancy, settings):
+        """Test that every request hits the database with CACHE_LIST_RESPONSES off"""
+        settings.CACHE_LIST_RESPONSES = False
+
+        landlord_client.get(TENANCIES_URL)
+        Tenancy.objects.filter(pk=tenancy.pk).update(monthly_rent=2000)
+        response = landlord_client.get(TENANCIES_URL)
+
+        assert response.data['results'][0]['monthly_rent'] == '2000.00'
+        assert cache.get(Tenancy.list_cache_key(landlord.pk, '')) is None
+
+
+@pytest.mark.django_db
+class TestTenancyListPagination:
+    """Test suite for the paginated, filtered tenancy list"""
+
+    @pytest.fixture
+    def tenancies(self, household):
+        """Three tenancies, newest start date first as the list orders them"""
+        return [
+            Tenancy.objects.create(household=household, start_date=date(2025, month, 1), status=status_)
+            for month, status_ in ((3, 'future'), (2, 'future'), (1, 'moved_out'))
+        ]
+
+    def test_list_envelope(self, landlord_client, tenancy):
+        """Test that the list wraps a page of results with its pagination links"""
+        response = landlord_client.get(TENANCIES_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {'success', 'count', 'next', 'previous', 'results'}
+        assert response.data['success'] is True
+        assert response.data['count'] == 1
+        assert response.data['next'] is None
+        assert response.data['previous'] is None
+        assert [result['id'] for result in response.data['results']] == [tenancy.id]
+
+    def test_list_page_size(self, landlord_client, tenancies):
+        """Test that page_size splits the list and next/previous link the pages"""
+        first = landlord_client.get(TENANCIES_URL, {'page_size': 2}).data
+
+        assert first['count'] == 3
+        assert [result['id'] for result in first['results']] == [t.id for t in tenancies[:2]]
+        assert first['previous'] is None
+        assert 'page=2' in first['next']
+
+        second = landlord_client.get(first['next']).data
+        assert [result['id'] for result in second['results']] == [tenancies[2].id]
+        assert second['next'] is None
+        assert second['previous'] is not None
+
+    def test_list_status_filter_paginates(self, landlord_client, tenancies):
+        """Test that the count and pages cover only tenancies with the requested status"""
+        data = landlord_client.get(TENANCIES_URL, {'status': 'future', 'page_size': 1}).data
+
+        assert data['count'] == 2
+        assert [result['id'] for result in data['results']] == [tenancies[0].id]
+        assert 'status=future' in data['next']
+
+        data = landlord_client.get(data['next']).data
+        assert [result['id'] for result in data['results']] == [tenancies[1].id]
+        assert data['next'] is None
+
+    def test_list_household_filter_paginates(self, landlord_client, landlord, tenancies):
+        """Test that the household filter is applied before paginating"""
+        other = Household.objects.create(landlord=landlord, name='Second Home', address='1 Side St')
+        other_tenancy = Tenancy.objects.create(household=other, start_date=date(2025, 6, 1))
+
+        data = landlord_client.get(TENANCIES_URL, {'household': other.id, 'page_size': 1}).data
+
+        assert data['count'] == 1
+        assert [result['id'] for result in data['results']] == [other_tenancy.id]
+        assert data['next'] is None
+
+    def test_list_search_paginates(self, landlord_client, tenant, tenancies):
+        """Test that searching by renter name narrows the count and pages"""
+        for tenancy in tenancies[1:]:
+            Renter.objects.create(tenancy=tenancy, user=tenant)
+
+        data = landlord_client.get(TENANCIES_URL, {'search': 'jane', 'page_size': 1}).data
+
+        assert data['count'] == 2
+        assert [result['id'] for result in data['results']] == [tenancies[1].id]
+        assert 'search=jane' in data['next']
+
+
+@pytest.mark.django_db
+class TestTenancyConflicts:
+    """Test suite for writes rejected by the tenancy and renter constraints"""
+
+    @pytest.fixture
+    def active_tenancy(self, household):
+        return Tenancy.objects.create(household=household, start_date=date(2024, 1, 1), status='active')
+
+    def test_activate_second_tenancy(self, landlord_client, household, tenancy, active_tenancy):
+        """Test that activating a second tenancy in the household is a 400"""
+        response = landlord_client.post(f'{TENANCIES_URL}{tenancy.id}/activate/')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == (
+            f'Household "{household.name}" already has an active tenancy. '
+            'Please move out the current tenancy before activating a new one.'
+        )
+        tenancy.refresh_from_db()
+        assert tenancy.status == 'future'
+
+    def test_create_second_active_tenancy(self, landlord_client, household, active_tenancy):
+        """Test that creating an active tenancy next to an active one is a 400"""
+        response = landlord_client.post(TENANCIES_URL, {
+            'household_id': household.id,
+            'start_date': '2025-01-01',
+            'status': 'active',
+        }, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'active tenancy' in response.data['error']
+        assert Tenancy.objects.filter(household=household, status='active').count() == 1
+
+    def test_add_existing_renter(self, landlord_client, tenancy, tenant):
+        """Test that adding a user who already rents in the tenancy is a 400"""
+        Renter.objects.create(tenancy=tenancy, user=tenant)
+
+        response = landlord_client.post(
+            f'{TENANCIES_URL}{tenancy.id}/add_renter/', {'email': tenant.email}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == f'User {tenant.email} is already a renter in this tenancy.'
+        assert tenancy.renters.count() == 1
+
+
+@pytest.mark.django_db
+class TestTenancyUpdate:
+    """Test suite for partially updating a tenancy"""
+
+    def test_update_end_date_before_stored_start_date(self, landlord_client, tenancy):
+        """Test that Tenancy.clean() still compares a new end date with the stored start date"""
+        response = landlord_client.patch(
+            f'{TENANCIES_URL}{tenancy.id}/', {'end_date': '2024-06-01'}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'End date must be after start date' in response.data['error']
+        tenancy.refresh_from_db()
+        assert tenancy.end_date is None
+
+    def test_update_status_to_second_active(self, landlord_client, household, tenancy):
+        """Test that changing the status to active next to an active tenancy is a 400"""
+        Tenancy.objects.create(household=household, start_date=date(2024, 1, 1), status='active')
+
+        response = landlord_client.patch(
+            f'{TENANCIES_URL}{tenancy.id}/', {'status': 'active'}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        tenancy.refresh_from_db()
+        assert tenancy.status == 'future'
+
+    def test_update_changes_only_sent_fields(self, landlord_client, tenancy):
+        """Test that only the fields in the request change"""
+        before = landlord_client.get(f'{TENANCIES_URL}{tenancy.id}/').data['data']
+
+        response = landlord_client.patch(
+            f'{TENANCIES_URL}{tenancy.id}/', {'monthly_rent': '1250.00'}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        after = response.data['data']
+        assert after['monthly_rent'] == '1250.00'
+        changed = {field for field in after if after[field] != before[field]}
+        assert changed - {'updated_at'} == {'monthly_rent'}
+        tenancy.refresh_from_db()
+        assert tenancy.monthly_rent == 1250
+        assert tenancy.start_date == date(2025, 1, 1)
+
+
+@pytest.mark.django_db
+class TestTenancyLandlordActions:
+    """Test suite for who may run the landlord-only tenancy actions"""
+
+    @pytest.mark.parametrize('method,path,denied_action', LANDLORD_ACTIONS)
+    def test_renter_forbidden(self, tenant_client, tenancy, tenant, method, path, denied_action):
+        """Test that a renter can see the tenancy but not change it"""
+        Renter.objects.create(tenancy=tenancy, user=tenant)
+
+        response = getattr(tenant_client, method)(f'{TENANCIES_URL}{tenancy.id}/{path}')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data['error'] == f'You do not have permission to {denied_action}.'
+        tenancy.refresh_from_db()
+        assert tenancy.status == 'future'
+
+    @pytest.mark.parametrize('method,path,denied_action', LANDLORD_ACTIONS)
+    def test_other_landlord_not_found(self, tenancy, method, path, denied_action):
+        """Test that another landlord's tenancies are hidden from them"""
+        other = User.objects.create_user(email='other@example.com', role='landlord')
+        client = APIClient()
+        client.force_authenticate(user=other)
+
+        response = getattr(client, method)(f'{TENANCIES_URL}{tenancy.id}/{path}')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_admin_allowed(self, admin_user, tenancy):
+        """Test that an admin may act on any household's tenancy"""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.post(f'{TENANCIES_URL}{tenancy.id}/activate/')
+
+        assert response.status_code == status.HTTP_200_OK
+        tenancy.refresh_from_db()
+        assert tenancy.status == 'active'
+
+
+@pytest.mark.django_db
+class TestTenancyRemoveRenter:
+    """Test suite for removing a renter from a tenancy"""
+
+    def test_remove_renter(self, landlord_client, tenancy, tenant):
+        """Test that the landlord can remove a renter"""
+        renter = Renter.objects.create(tenancy=tenancy, user=tenant)
+
+        response = landlord_client.delete(f'{TENANCIES_URL}{tenancy.id}/renters/{renter.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not Renter.objects.filter(pk=renter.pk).exists()
+
+    def test_remove_unknown_renter(self, landlord_client, tenancy):
+        """Test that an unknown renter id is a 404"""
+        response = landlord_client.delete(f'{TENANCIES_URL}{tenancy.id}/renters/999999/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_remove_renter_of_other_tenancy(self, landlord_client, household, tenancy, tenant):
+        """Test that a renter of another tenancy is a 404 and stays put"""
+        other_tenancy = Tenancy.objects.create(household=household, start_date=date(2024, 1, 1))
+        renter = Renter.objects.create(tenancy=other_tenancy, user=tenant)
+
+        response = landlord_client.delete(f'{TENANCIES_URL}{tenancy.id}/renters/{renter.id}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert Renter.objects.filter(pk=renter.pk).exists()
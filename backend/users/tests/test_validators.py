@@ -0,0 +1,36 @@
+import pytest
+from django.core.exceptions import ValidationError
+from users.validators import CommonPasswordValidator
+
+
+class TestCommonPasswordValidator:
+    """Test suite for the cached CommonPasswordValidator"""
+
+    def test_rejects_common_password(self):
+        """Test that a password from the default list is rejected"""
+        with pytest.raises(ValidationError):
+            CommonPasswordValidator().validate('password')
+
+    def test_rejects_common_password_case_insensitive(self):
+        """Test that the lookup ignores case and surrounding whitespace"""
+        with pytest.raises(ValidationError):
+            CommonPasswordValidator().validate('  PassWord ')
+
+    def test_accepts_uncommon_password(self):
+        """Test that an uncommon password passes validation"""
+        CommonPasswordValidator().validate('q7#Lm!vX2pZr')
+
+    def test_word_list_shared_between_instances(self):
+        """Test that instances reuse the same loaded word list"""
+        assert CommonPasswordValidator().passwords is CommonPasswordValidator().passwords
+
+    def test_custom_plain_text_list(self, tmp_path):
+        """Test loading a custom uncompressed password list"""
+        password_list = tmp_path / 'passwords.txt'
+        password_list.write_text('hunter2secret\n')
+
+        validator = CommonPasswordValidator(password_list_path=password_list)
+
+        assert validator.passwords == frozenset({'hunter2secret'})
+        with pytest.raises(ValidationError):
+            validator.validate('Hunter2Secret')
@@ -0,0 +1,42 @@
+"""Password validators for the users app."""
+import gzip
+from functools import lru_cache
+from pathlib import Path
+
+from django.contrib.auth import password_validation
+
+DEFAULT_PASSWORD_LIST_PATH = (
+    Path(password_validation.__file__).resolve().parent / 'common-passwords.txt.gz'
+)
+
+
+@lru_cache(maxsize=None)
+def load_password_list(path):
+    """
+    Load a common-password list once per process.
+
+    Args:
+        path: Path to a plain or gzip-compressed word list, one password per line
+
+    Returns:
+        frozenset: Lower-cased passwords from the list
+    """
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return frozenset(line.strip() for line in f)
+    except OSError:
+        with open(path, encoding='utf-8') as f:
+            return frozenset(line.strip() for line in f)
+
+
+class CommonPasswordValidator(password_validation.CommonPasswordValidator):
+    """
+    Drop-in for Django's CommonPasswordValidator sharing one word list.
+
+    Django re-reads and decompresses the ~20k-entry list every time the
+    validator is instantiated (e.g. whenever AUTH_PASSWORD_VALIDATORS is
+    reloaded). This variant keeps a single frozenset per list path.
+    """
+
+    def __init__(self, password_list_path=None):
+        self.passwords = load_password_list(str(password_list_path or DEFAULT_PASSWORD_LIST_PATH))
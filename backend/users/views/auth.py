@@ -10,7 +10,7 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from pydantic import ValidationError as PydanticValidationError
 
-from ..models import User
+from ..models import Tenancy, User
 from ..serializers import (
     UserSerializer,
     UserRegistrationSerializer,
@@ -88,9 +88,8 @@ class LoginView(TokenObtainPairView):
         """Override post to add debugging."""
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"Login attempt - Request data: {request.data}")
-        logger.info(f"Login attempt - Email field: {request.data.get('email')}")
-        logger.info(f"Login attempt - Has password: {bool(request.data.get('password'))}")
+        logger.info("Login attempt - Email field: %s", request.data.get('email'))
+        logger.info("Login attempt - Has password: %s", bool(request.data.get('password')))
         return super().post(request, *args, **kwargs)
 
 
@@ -178,6 +177,8 @@ class CurrentUserView(APIView):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        # The user may be a renter shown in cached tenancy lists
+        Tenancy.invalidate_list_cache()
         return Response(serializer.data)
 
 
@@ -1,18 +1,75 @@
-from rest_framework import viewsets, status
+import operator
+
+from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from project.pagination import StandardPageNumberPagination
 from ..models import Household, HouseholdMembership, User, TenantInvitation
-from ..serializers import HouseholdSerializer, HouseholdMembershipSerializer, UserSerializer
+from ..serializers import (
+    HouseholdSerializer, HouseholdMembershipSerializer, LandlordSerializer, UserSerializer,
+)
 from ..permissions import IsLandlordOrAdmin, IsHouseholdLandlord
-from .invitations import send_invitation_email
+from .invitations import queue_invitation_email
+
+_membership_fields = operator.attrgetter('id', 'role', 'joined_at', 'is_active')
+
+# Tenant columns UserSerializer renders, as lookups from a membership
+TENANT_COLUMNS = tuple(f'tenant__{field}' for field in UserSerializer.Meta.fields)
+
+# Renders datetimes the way the serializers' DateTimeFields do. date_joined is
+# the only UserSerializer field that is not a plain value.
+_datetime_field = serializers.DateTimeField()
+
+
+def _tenant_payload(values):
+    """Build UserSerializer's output for a tenant from its field values, in field order."""
+    tenant_data = dict(zip(UserSerializer.Meta.fields, values))
+    tenant_data['date_joined'] = _datetime_field.to_representation(tenant_data['date_joined'])
+    return tenant_data
+
+
+# Renderers for the HouseholdSerializer fields that are not plain values;
+# every other field in Meta.fields is copied from the instance as is
+_household_renderers = {
+    'landlord': LandlordSerializer().to_representation,
+    'created_at': _datetime_field.to_representation,
+    'updated_at': _datetime_field.to_representation,
+}
+
+
+def _household_payload(household):
+    """Build HouseholdSerializer's output for an annotated household with its landlord loaded."""
+    payload = {}
+    for field in HouseholdSerializer.Meta.fields:
+        value = getattr(household, field)
+        render = _household_renderers.get(field)
+        payload[field] = render(value) if render else value
+    return payload
+
+
+def _membership_payload(membership_values, tenant_data):
+    """Render a membership from its (id, role, joined_at, is_active) values and serialized tenant."""
+    membership_id, role, joined_at, is_active = membership_values
+    return {
+        'id': membership_id,
+        'tenant': tenant_data,
+        'role': role,
+        'joined_at': joined_at,
+        'is_active': is_active,
+    }
 
 
 class HouseholdViewSet(viewsets.ModelViewSet):
     """ViewSet for managing households."""
     serializer_class = HouseholdSerializer
+    pagination_class = StandardPageNumberPagination
 
     def get_permissions(self):
         """
@@ -34,49 +91,42 @@ class HouseholdViewSet(viewsets.ModelViewSet):
         user = self.request.user
 
         if user.is_admin():
-            return Household.objects.all()
-
-        if user.is_landlord():
+            queryset = Household.objects.all()
+        elif user.is_landlord():
             # Landlords see households they own
-            return Household.objects.filter(landlord=user)
+            queryset = Household.objects.filter(landlord=user)
+        else:
+            # Tenants see households they're members of. EXISTS avoids the
+            # duplicate rows a join would produce, so no DISTINCT is needed.
+            queryset = Household.objects.filter(Exists(
+                HouseholdMembership.objects.filter(
+                    household=OuterRef('pk'),
+                    tenant=user,
+                    is_active=True
+                )
+            ))
 
-        # Tenants see households they're members of
-        return Household.objects.filter(
-            memberships__tenant=user,
-            memberships__is_active=True
-        ).distinct()
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     def perform_create(self, serializer):
         """Set the landlord to the current user when creating a household."""
         serializer.save(landlord=self.request.user)
 
     def list(self, request, *args, **kwargs):
-        """List all households for the current user with member details."""
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        """List a page of households for the current user with member details."""
+        households = self.paginate_queryset(self.get_queryset())
 
-        # Add member details to each household
-        data = serializer.data
-        for household_data in data:
-            household = Household.objects.get(id=household_data['id'])
-            memberships = HouseholdMembership.objects.filter(
-                household=household,
-                is_active=True
-            ).select_related('tenant')
-
-            members = []
-            for membership in memberships:
-                if membership.tenant:
-                    members.append({
-                        'id': membership.id,
-                        'tenant': UserSerializer(membership.tenant).data,
-                        'role': membership.role,
-                        'joined_at': membership.joined_at,
-                        'is_active': membership.is_active,
-                    })
-            household_data['members'] = members
-
-        return Response({'results': data})
+        # Households are read-only here, so they are rendered straight from
+        # the loaded rows rather than through HouseholdSerializer. Members of
+        # the whole page are read in one query.
+        members = self._active_members([household.pk for household in households])
+        data = []
+        for household in households:
+            household_data = _household_payload(household)
+            household_data['members'] = members[household.pk]
+            data.append(household_data)
+
+        return self.get_paginated_response(data)
 
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a specific household with member details."""
@@ -85,22 +135,7 @@ class HouseholdViewSet(viewsets.ModelViewSet):
         data = serializer.data
 
         # Add member details
-        memberships = HouseholdMembership.objects.filter(
-            household=instance,
-            is_active=True
-        ).select_related('tenant')
-
-        members = []
-        for membership in memberships:
-            if membership.tenant:
-                members.append({
-                    'id': membership.id,
-                    'tenant': UserSerializer(membership.tenant).data,
-                    'role': membership.role,
-                    'joined_at': membership.joined_at,
-                    'is_active': membership.is_active,
-                })
-        data['members'] = members
+        data['members'] = self._active_members([instance.pk])[instance.pk]
 
         return Response(data)
 
@@ -108,23 +143,30 @@ class HouseholdViewSet(viewsets.ModelViewSet):
     def members(self, request, pk=None):
         """Get all members of a household."""
         household = self.get_object()
-        memberships = HouseholdMembership.objects.filter(
-            household=household,
-            is_active=True
-        ).select_related('tenant')
+        return Response({'members': self._active_members([household.pk])[household.pk]})
+
+    def _active_members(self, household_ids):
+        """
+        Render the active members of the given households, keyed by household id.
 
-        members = []
-        for membership in memberships:
-            if membership.tenant:
-                members.append({
-                    'id': membership.id,
-                    'tenant': UserSerializer(membership.tenant).data,
-                    'role': membership.role,
-                    'joined_at': membership.joined_at,
-                    'is_active': membership.is_active,
-                })
+        Memberships are read as flat rows in one query instead of membership
+        and user instances; the tenant dict is assembled in UserSerializer's
+        field order and format, once per tenant.
+        """
+        members = {household_id: [] for household_id in household_ids}
+        rows = HouseholdMembership.objects.filter(
+            household_id__in=household_ids,
+            is_active=True
+        ).values_list('household_id', 'id', 'role', 'joined_at', 'is_active', *TENANT_COLUMNS)
 
-        return Response({'members': members})
+        serialized_tenants = {}
+        for row in rows:
+            # row[5] is tenant__id, the first UserSerializer field
+            tenant_data = serialized_tenants.get(row[5])
+            if tenant_data is None:
+                tenant_data = serialized_tenants[row[5]] = _tenant_payload(row[5:])
+            members[row[0]].append(_membership_payload(row[1:5], tenant_data))
+        return members
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsHouseholdLandlord])
     def add_member(self, request, pk=None):
@@ -141,33 +183,41 @@ class HouseholdViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Try to find existing user
-        user_exists = User.objects.filter(email=email).exists()
-
-        if user_exists:
-            tenant = User.objects.get(email=email)
+        # Reject malformed addresses before any user or invitation lookup, and
+        # normalize the rest the way create_user() stores them
+        email = User.objects.normalize_email(str(email).strip())
+        try:
+            validate_email(email)
+        except DjangoValidationError:
+            return Response(
+                {'error': 'Enter a valid email address'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            # Check if already a member
-            if HouseholdMembership.objects.filter(household=household, tenant=tenant).exists():
-                return Response(
-                    {'error': 'User is already a member of this household'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        # Try to find existing user
+        tenant = User.objects.filter(email=email).first()
 
-            # Add existing user as member
-            membership = HouseholdMembership.objects.create(
+        if tenant is not None:
+            # Add existing user as member; the unique (household, tenant)
+            # constraint makes this a single atomic check-and-insert
+            membership, created = HouseholdMembership.objects.get_or_create(
                 household=household,
                 tenant=tenant,
-                role='tenant',
-                invited_by=request.user
+                defaults={'role': 'tenant', 'invited_by': request.user}
             )
 
+            if not created:
+                if membership.is_active:
+                    return Response(
+                        {'error': 'User is already a member of this household'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                # Re-adding a removed member restores the soft-deleted row
+                membership.is_active = True
+                membership.save(update_fields=['is_active'])
+
             return Response({
-                'id': membership.id,
-                'tenant': UserSerializer(tenant).data,
-                'role': membership.role,
-                'joined_at': membership.joined_at,
-                'is_active': membership.is_active,
+                **_membership_payload(_membership_fields(membership), UserSerializer(tenant).data),
                 'invitation_sent': False,
             }, status=status.HTTP_201_CREATED)
         else:
@@ -177,7 +227,7 @@ class HouseholdViewSet(viewsets.ModelViewSet):
                 email=email,
                 household=household,
                 accepted_at__isnull=True
-            ).first()
+            ).only('id', 'expires_at', 'accepted_at').first()
 
             if existing_invitation and existing_invitation.is_valid():
                 return Response(
@@ -185,29 +235,27 @@ class HouseholdViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Create new invitation
-            invitation = TenantInvitation.objects.create(
-                email=email,
-                household=household,
-                invited_by=request.user
-            )
+            # Create the invitation and the inactive account in one commit.
+            # The email is queued for after that commit, so a rolled-back
+            # invite never sends mail.
+            with transaction.atomic():
+                invitation = TenantInvitation.objects.create(
+                    email=email,
+                    household=household,
+                    invited_by=request.user
+                )
 
-            # Create inactive user account
-            inactive_user = User.objects.create_user(
-                email=email,
-                first_name=first_name or '',
-                last_name=last_name or '',
-                phone_number=phone_number or '',
-                role='tenant',
-                is_active=False,  # Inactive until they accept invitation
-            )
+                # Create inactive user account
+                User.objects.create_user(
+                    email=email,
+                    first_name=first_name or '',
+                    last_name=last_name or '',
+                    phone_number=phone_number or '',
+                    role='tenant',
+                    is_active=False,  # Inactive until they accept invitation
+                )
 
-            # Send invitation email
-            try:
-                send_invitation_email(invitation)
-            except Exception as e:
-                # Log error but don't fail the request
-                print(f"Failed to send invitation email: {e}")
+                queue_invitation_email(invitation)
 
             return Response({
                 'message': f'Invitation sent to {email}',
@@ -223,18 +271,20 @@ class HouseholdViewSet(viewsets.ModelViewSet):
         """Remove a member from the household."""
         household = self.get_object()
 
-        try:
-            membership = HouseholdMembership.objects.get(
-                household=household,
-                tenant_id=user_id,
-                is_active=True
-            )
-            membership.is_active = False
-            membership.save()
+        # Soft delete in a single UPDATE; zero rows means no active membership
+        updated = HouseholdMembership.objects.filter(
+            household=household,
+            tenant_id=user_id,
+            is_active=True
+        ).update(is_active=False)
 
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        except HouseholdMembership.DoesNotExist:
+        if not updated:
             return Response(
                 {'error': 'Member not found in this household'},
                 status=status.HTTP_404_NOT_FOUND
             )
+
+        # update() bypasses HouseholdMembership.save(), so clear the status here
+        cache.delete(Household.onboarding_cache_key(household.landlord_id))
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
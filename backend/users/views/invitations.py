@@ -1,15 +1,22 @@
+from functools import lru_cache
+
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.core.cache import cache
 from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.conf import settings
 from django.utils import timezone
 
-from ..models import TenantInvitation, User, HouseholdMembership
+from ..models import TenantInvitation, Tenancy, User, HouseholdMembership
 from ..serializers import TenantInvitationSerializer, InvitationAcceptSerializer
 from ..permissions import IsLandlordOrAdmin
+from ..tasks import run_after_commit
+
+# Seconds a successful verify response is served from the cache
+VERIFY_CACHE_TIMEOUT = 60
 
 
 class InvitationViewSet(viewsets.ModelViewSet):
@@ -23,8 +30,10 @@ class InvitationViewSet(viewsets.ModelViewSet):
         """Return invitations for households owned by the current user."""
         user = self.request.user
         if user.is_admin():
-            return TenantInvitation.objects.all()
-        return TenantInvitation.objects.filter(invited_by=user)
+            queryset = TenantInvitation.objects.all()
+        else:
+            queryset = TenantInvitation.objects.filter(invited_by=user)
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     @action(detail=False, methods=['post'], permission_classes=[AllowAny])
     def verify(self, request):
@@ -43,27 +52,41 @@ class InvitationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            invitation = TenantInvitation.objects.get(token=token)
-
-            if not invitation.is_valid():
-                return Response(
-                    {'error': 'This invitation has expired or has already been accepted'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        cache_key = TenantInvitation.verify_cache_key(token)
+        payload = cache.get(cache_key)
+        if payload is not None:
+            return Response(payload)
 
-            return Response({
-                'valid': True,
-                'email': invitation.email,
-                'household_name': invitation.household.name,
-                'invited_by': invitation.invited_by.get_full_name(),
-            })
+        try:
+            invitation = TenantInvitation.objects.select_related(
+                'household', 'invited_by'
+            ).only(
+                'email', 'expires_at', 'accepted_at', 'household__name',
+                'invited_by__first_name', 'invited_by__last_name', 'invited_by__email',
+            ).get(token=token)
         except TenantInvitation.DoesNotExist:
             return Response(
                 {'error': 'Invalid invitation token'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        if not invitation.is_valid():
+            return Response(
+                {'error': 'This invitation has expired or has already been accepted'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        payload = {
+            'valid': True,
+            'email': invitation.email,
+            'household_name': invitation.household.name,
+            'invited_by': invitation.invited_by.get_full_name(),
+        }
+        # Never cache a valid result past the invitation's own expiry
+        seconds_left = int((invitation.expires_at - timezone.now()).total_seconds())
+        cache.set(cache_key, payload, min(VERIFY_CACHE_TIMEOUT, seconds_left))
+        return Response(payload)
+
     @action(detail=False, methods=['post'], permission_classes=[AllowAny])
     def accept(self, request):
         """
@@ -85,7 +108,9 @@ class InvitationViewSet(viewsets.ModelViewSet):
         token = serializer.validated_data['token']
 
         try:
-            invitation = TenantInvitation.objects.get(token=token)
+            invitation = TenantInvitation.objects.select_related(
+                'household', 'invited_by'
+            ).get(token=token)
 
             if not invitation.is_valid():
                 return Response(
@@ -94,10 +119,9 @@ class InvitationViewSet(viewsets.ModelViewSet):
                 )
 
             # Check if user already exists
-            user_exists = User.objects.filter(email=invitation.email).exists()
+            user = User.objects.filter(email=invitation.email).first()
 
-            if user_exists:
-                user = User.objects.get(email=invitation.email)
+            if user is not None:
                 # If user exists but is inactive, activate and set password
                 if not user.is_active:
                     user.set_password(serializer.validated_data['password'])
@@ -106,6 +130,8 @@ class InvitationViewSet(viewsets.ModelViewSet):
                     user.last_name = serializer.validated_data.get('last_name', user.last_name)
                     user.phone_number = serializer.validated_data.get('phone_number', user.phone_number)
                     user.save()
+                    # Cached tenancy lists show renter names and emails
+                    Tenancy.invalidate_list_cache()
             else:
                 # Create new user
                 user = User.objects.create_user(
@@ -144,6 +170,15 @@ class InvitationViewSet(viewsets.ModelViewSet):
             )
 
 
+@lru_cache(maxsize=None)
+def _invitation_templates():
+    """Load and compile the (html, txt) invitation templates once per process."""
+    return (
+        get_template('emails/tenant_invitation.html'),
+        get_template('emails/tenant_invitation.txt'),
+    )
+
+
 def send_invitation_email(invitation):
     """
     Send invitation email to tenant.
@@ -160,8 +195,9 @@ def send_invitation_email(invitation):
     }
 
     # Render email templates
-    html_message = render_to_string('emails/tenant_invitation.html', context)
-    plain_message = render_to_string('emails/tenant_invitation.txt', context)
+    html_template, plain_template = _invitation_templates()
+    html_message = html_template.render(context)
+    plain_message = plain_template.render(context)
 
     # Send email
     send_mail(
@@ -172,3 +208,16 @@ def send_invitation_email(invitation):
         html_message=html_message,
         fail_silently=False,
     )
+
+
+def queue_invitation_email(invitation):
+    """
+    Send the invitation email in the background once the transaction commits.
+
+    Rendering and the SMTP round trip run off the request, and nothing is sent
+    for an invitation whose transaction rolls back. Failures are logged.
+
+    Args:
+        invitation: TenantInvitation instance with household and invited_by loaded
+    """
+    run_after_commit(send_invitation_email, invitation)
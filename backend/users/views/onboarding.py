@@ -1,22 +1,31 @@
 import os
 import logging
+from datetime import timedelta
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 from pydantic import ValidationError as PydanticValidationError
 
 from ..models import User, Household, HouseholdMembership, TenancyAgreement, Tenancy, Renter
+from ..permissions import IsLandlordOrAdmin
 from ..serializers import (
     HouseholdSerializer,
     TenancyAgreementSerializer,
     UserSerializer,
 )
-from ..emails import send_welcome_email
+from ..tasks import (
+    extract_tenancy_agreement,
+    get_extraction_provider,
+    run_after_commit,
+    welcome_new_tenant,
+)
 from ..schemas import (
     HouseholdOnboardingSchema,
     LandlordUpdateSchema,
@@ -28,14 +37,32 @@ from ..schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds the onboarding status's household/tenant flags are served from the cache
+ONBOARDING_STATUS_CACHE_TIMEOUT = 30
+
+# File types accepted for tenancy agreement uploads, and the error listing them
+TENANCY_UPLOAD_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png', '.xlsx', '.xls', '.docx', '.doc')
+_tenancy_upload_extension_set = frozenset(TENANCY_UPLOAD_EXTENSIONS)
+_unsupported_file_type_error = (
+    f'File type not supported. Allowed types: {", ".join(TENANCY_UPLOAD_EXTENSIONS)}'
+)
+
+# A pending or processing agreement uploaded longer ago than this is assumed
+# abandoned (its background thread died with a worker restart), and
+# process_tenancy may take it over
+EXTRACTION_STALE_AFTER = timedelta(minutes=10)
 
-class IsLandlordOrAdmin(IsAuthenticated):
-    """Custom permission to only allow landlords or admins"""
 
-    def has_permission(self, request, view):
-        if not super().has_permission(request, view):
-            return False
-        return request.user.is_landlord() or request.user.is_admin()
+def _advance_onboarding_step(user, step):
+    """
+    Raise the user's onboarding step to `step`; never move it back.
+
+    The write is a single conditional UPDATE, so two concurrent requests
+    cannot lower a step the other one has just raised.
+    """
+    if user.onboarding_step < step:
+        User.objects.filter(pk=user.pk, onboarding_step__lt=step).update(onboarding_step=step)
+        user.onboarding_step = step
 
 
 class OnboardingViewSet(viewsets.ViewSet):
@@ -57,18 +84,19 @@ class OnboardingViewSet(viewsets.ViewSet):
             # Validate with Pydantic
             household_data = HouseholdOnboardingSchema(**request.data)
 
-            # Create household
-            household = Household.objects.create(
-                name=household_data.name,
-                address=household_data.address,
-                landlord=request.user
-            )
+            # Create the household and advance the onboarding step in one commit
+            with transaction.atomic():
+                household = Household.objects.create(
+                    name=household_data.name,
+                    address=household_data.address,
+                    landlord=request.user
+                )
 
-            # Update onboarding step
-            if request.user.onboarding_step < 1:
-                request.user.onboarding_step = 1
-                request.user.save(update_fields=['onboarding_step'])
+                _advance_onboarding_step(request.user, 1)
 
+            # The landlord is request.user and a new household has no members,
+            # so the response needs no further queries
+            household._member_count = 0
             serializer = HouseholdSerializer(household)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -78,7 +106,7 @@ class OnboardingViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error creating household: {str(e)}")
+            logger.error("Error creating household: %s", e)
             return Response(
                 {'error': 'Failed to create household'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -101,22 +129,22 @@ class OnboardingViewSet(viewsets.ViewSet):
             # Validate with Pydantic
             landlord_data = LandlordUpdateSchema(**request.data)
 
-            # Update user fields
-            if landlord_data.first_name is not None:
-                request.user.first_name = landlord_data.first_name
-            if landlord_data.last_name is not None:
-                request.user.last_name = landlord_data.last_name
-            if landlord_data.email is not None:
-                request.user.email = landlord_data.email
-            if landlord_data.phone_number is not None:
-                request.user.phone_number = landlord_data.phone_number
+            # Update only the fields the client actually provided
+            changes = landlord_data.model_dump(exclude_unset=True, exclude_none=True)
+            for field, value in changes.items():
+                setattr(request.user, field, value)
 
-            request.user.save()
-
-            # Update onboarding step
+            # Update onboarding step in the same UPDATE
+            update_fields = list(changes)
             if request.user.onboarding_step < 2:
                 request.user.onboarding_step = 2
-                request.user.save(update_fields=['onboarding_step'])
+                update_fields.append('onboarding_step')
+
+            if update_fields:
+                request.user.save(update_fields=update_fields)
+            if changes:
+                # Name and email changes must not be served from cached tenancy lists
+                Tenancy.invalidate_list_cache()
 
             serializer = UserSerializer(request.user)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -127,7 +155,7 @@ class OnboardingViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error updating landlord: {str(e)}")
+            logger.error("Error updating landlord: %s", e)
             return Response(
                 {'error': 'Failed to update landlord information'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -149,24 +177,21 @@ class OnboardingViewSet(viewsets.ViewSet):
             # Validate household_id with Pydantic
             upload_data = TenancyUploadSchema(household_id=request.data.get('household_id'))
 
-            # Get household and verify ownership
-            try:
-                household = Household.objects.get(
-                    id=upload_data.household_id,
-                    landlord=request.user
+            # Verify ownership; one lookup tells a missing household from
+            # someone else's. name is loaded for the response's household_name.
+            household = Household.objects.filter(
+                id=upload_data.household_id
+            ).only('id', 'name', 'landlord_id').first()
+            if household is None:
+                return Response(
+                    {'error': f'Household with ID {upload_data.household_id} not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            if household.landlord_id != request.user.id:
+                return Response(
+                    {'error': 'You do not have permission to upload files for this household'},
+                    status=status.HTTP_403_FORBIDDEN
                 )
-            except Household.DoesNotExist:
-                # Check if household exists at all
-                if Household.objects.filter(id=upload_data.household_id).exists():
-                    return Response(
-                        {'error': 'You do not have permission to upload files for this household'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-                else:
-                    return Response(
-                        {'error': f'Household with ID {upload_data.household_id} not found'},
-                        status=status.HTTP_404_NOT_FOUND
-                    )
 
             # Validate file
             if 'file' not in request.FILES:
@@ -178,7 +203,6 @@ class OnboardingViewSet(viewsets.ViewSet):
             uploaded_file = request.FILES['file']
 
             # Check file size (10MB max)
-            from django.conf import settings
             max_size = getattr(settings, 'MAX_UPLOAD_SIZE', 10485760)
             if uploaded_file.size > max_size:
                 return Response(
@@ -187,11 +211,10 @@ class OnboardingViewSet(viewsets.ViewSet):
                 )
 
             # Check file type
-            allowed_extensions = ['.pdf', '.jpg', '.jpeg', '.png', '.xlsx', '.xls', '.docx', '.doc']
             file_ext = os.path.splitext(uploaded_file.name)[1].lower()
-            if file_ext not in allowed_extensions:
+            if file_ext not in _tenancy_upload_extension_set:
                 return Response(
-                    {'error': f'File type not supported. Allowed types: {", ".join(allowed_extensions)}'},
+                    {'error': _unsupported_file_type_error},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
@@ -199,29 +222,11 @@ class OnboardingViewSet(viewsets.ViewSet):
             tenancy_agreement = TenancyAgreement.objects.create(
                 household=household,
                 file=uploaded_file,
-                status='processing'  # Set to processing immediately
             )
 
-            # Automatically trigger AI extraction
-            try:
-                from ai_services.providers import GeminiProvider
-                provider = GeminiProvider()
-
-                file_path = tenancy_agreement.file.path
-                extracted_data = provider.extract_tenant_data(file_path)
-
-                # Update with extracted data
-                tenancy_agreement.extracted_data = extracted_data
-                tenancy_agreement.status = 'processed'
-                tenancy_agreement.save(update_fields=['extracted_data', 'status'])
-
-                logger.info(f"Successfully extracted data from tenancy agreement {tenancy_agreement.id}")
-
-            except Exception as extraction_error:
-                logger.error(f"Error extracting tenant data: {str(extraction_error)}")
-                tenancy_agreement.status = 'failed'
-                tenancy_agreement.save(update_fields=['status'])
-                # Don't fail the upload, just mark as failed extraction
+            # AI extraction takes seconds, so it runs in the background; clients
+            # poll the agreement endpoint until the status leaves pending/processing
+            run_after_commit(extract_tenancy_agreement, tenancy_agreement.id)
 
             serializer = TenancyAgreementSerializer(tenancy_agreement)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -232,18 +237,37 @@ class OnboardingViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error uploading tenancy agreement: {str(e)}")
+            logger.error("Error uploading tenancy agreement: %s", e)
             return Response(
                 {'error': 'Failed to upload tenancy agreement'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @action(detail=True, methods=['get'], url_path='agreement')
+    def get_tenancy_agreement(self, request, pk=None):
+        """
+        Get a tenancy agreement, to poll its background extraction
+
+        GET /api/users/onboarding/{id}/agreement/
+        """
+        tenancy_agreement = get_object_or_404(
+            TenancyAgreement,
+            id=pk,
+            household__landlord=request.user
+        )
+        serializer = TenancyAgreementSerializer(tenancy_agreement)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=['post'], url_path='process')
     def process_tenancy(self, request, pk=None):
         """
         Trigger AI extraction for tenancy agreement
 
-        POST /api/users/onboarding/tenancy/{id}/process/
+        POST /api/users/onboarding/{id}/process/
+
+        Retries a failed extraction, and is the recovery path for an
+        agreement left pending or processing past EXTRACTION_STALE_AFTER.
+        While the background extraction is still running it answers 409.
         """
         try:
             # Get tenancy agreement and verify ownership
@@ -253,22 +277,31 @@ class OnboardingViewSet(viewsets.ViewSet):
                 household__landlord=request.user
             )
 
-            # Check if already processed
+            # Already processed: return the extracted data as is
             if tenancy_agreement.status == 'processed':
+                serializer = TenancyAgreementSerializer(tenancy_agreement)
+                return Response(serializer.data, status=status.HTTP_200_OK)
+
+            # Claim the agreement with a conditional UPDATE, so this request
+            # never runs alongside the background extraction or another retry
+            claimable = Q(status='failed') | Q(
+                status__in=('pending', 'processing'),
+                uploaded_at__lt=timezone.now() - EXTRACTION_STALE_AFTER
+            )
+            claimed = TenancyAgreement.objects.filter(
+                claimable, pk=tenancy_agreement.pk
+            ).update(status='processing')
+            if not claimed:
                 return Response(
-                    {'message': 'Tenancy agreement already processed'},
-                    status=status.HTTP_200_OK
+                    {'error': 'Tenancy agreement is still being processed'},
+                    status=status.HTTP_409_CONFLICT
                 )
-
-            # Update status to processing
             tenancy_agreement.status = 'processing'
-            tenancy_agreement.save(update_fields=['status'])
 
             try:
-                # Lazy import AI provider (only when needed)
+                # The provider is imported lazily and shared across requests
                 try:
-                    from ai_services.providers import GeminiProvider
-                    provider = GeminiProvider()
+                    provider = get_extraction_provider()
                 except ImportError:
                     raise Exception("AI service dependencies not installed. Please install google-generativeai.")
 
@@ -281,15 +314,13 @@ class OnboardingViewSet(viewsets.ViewSet):
                 tenancy_agreement.save(update_fields=['extracted_data', 'status'])
 
                 # Update onboarding step
-                if request.user.onboarding_step < 3:
-                    request.user.onboarding_step = 3
-                    request.user.save(update_fields=['onboarding_step'])
+                _advance_onboarding_step(request.user, 3)
 
                 serializer = TenancyAgreementSerializer(tenancy_agreement)
                 return Response(serializer.data, status=status.HTTP_200_OK)
 
             except Exception as extraction_error:
-                logger.error(f"Error extracting tenant data: {str(extraction_error)}")
+                logger.error("Error extracting tenant data: %s", extraction_error)
                 tenancy_agreement.status = 'failed'
                 tenancy_agreement.save(update_fields=['status'])
                 return Response(
@@ -298,7 +329,7 @@ class OnboardingViewSet(viewsets.ViewSet):
                 )
 
         except Exception as e:
-            logger.error(f"Error processing tenancy agreement: {str(e)}")
+            logger.error("Error processing tenancy agreement: %s", e)
             return Response(
                 {'error': 'Failed to process tenancy agreement'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -330,43 +361,48 @@ class OnboardingViewSet(viewsets.ViewSet):
 
             # Get tenancy agreement and verify ownership + processed status
             tenancy_agreement = get_object_or_404(
-                TenancyAgreement,
+                TenancyAgreement.objects.select_related('household'),
                 id=confirm_data.tenancy_agreement_id,
                 household__landlord=request.user,
                 status='processed'
             )
 
-            # Check if tenancy already exists for this tenancy agreement
-            from ..models import Tenancy
+            # Check if tenancy already exists for this tenancy agreement.
+            # Scoping to the household lets the household foreign key index
+            # narrow the search to that household's few tenancies before the
+            # unindexed file name is compared.
             existing_tenancy = Tenancy.objects.filter(
+                household_id=tenancy_agreement.household_id,
                 proof_document=tenancy_agreement.file
             ).first()
 
+            confirmed_fields = {
+                'name': confirm_data.tenancy_name,
+                'start_date': confirm_data.start_date,
+                'end_date': confirm_data.end_date,
+                'monthly_rent': confirm_data.monthly_rent,
+                'deposit': confirm_data.deposit,
+                'status': 'active' if confirm_data.start_date <= timezone.localdate() else 'future',
+            }
+
             if existing_tenancy:
-                # UPDATE existing tenancy
-                existing_tenancy.name = confirm_data.tenancy_name
-                existing_tenancy.start_date = confirm_data.start_date
-                existing_tenancy.end_date = confirm_data.end_date
-                existing_tenancy.monthly_rent = confirm_data.monthly_rent
-                existing_tenancy.deposit = confirm_data.deposit
-                existing_tenancy.status = 'active' if confirm_data.start_date <= timezone.now().date() else 'future'
-                existing_tenancy.save()
-
-                logger.info(f"Updated existing tenancy {existing_tenancy.id} for household {existing_tenancy.household.id}")
+                # UPDATE only the confirmed columns (and the auto_now stamp)
+                for field, value in confirmed_fields.items():
+                    setattr(existing_tenancy, field, value)
+                existing_tenancy.save(update_fields=[*confirmed_fields, 'updated_at'])
+                # Already loaded with the agreement; spares the serializer a query
+                existing_tenancy.household = tenancy_agreement.household
+
+                logger.info("Updated existing tenancy %s for household %s", existing_tenancy.id, existing_tenancy.household_id)
                 tenancy = existing_tenancy
             else:
                 # CREATE new tenancy
                 tenancy = Tenancy.objects.create(
                     household=tenancy_agreement.household,
-                    name=confirm_data.tenancy_name,
-                    start_date=confirm_data.start_date,
-                    end_date=confirm_data.end_date,
-                    monthly_rent=confirm_data.monthly_rent,
-                    deposit=confirm_data.deposit,
-                    status='active' if confirm_data.start_date <= timezone.now().date() else 'future',
-                    proof_document=tenancy_agreement.file  # Link the proof document
+                    proof_document=tenancy_agreement.file,  # Link the proof document
+                    **confirmed_fields
                 )
-                logger.info(f"Created new tenancy {tenancy.id} for household {tenancy.household.id}")
+                logger.info("Created new tenancy %s for household %s", tenancy.id, tenancy.household_id)
 
             # Return tenancy data
             from ..serializers import TenancySerializer
@@ -379,7 +415,7 @@ class OnboardingViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error confirming tenancy: {str(e)}")
+            logger.error("Error confirming tenancy: %s", e)
             return Response(
                 {'error': f'Failed to create tenancy: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -424,14 +460,17 @@ class OnboardingViewSet(viewsets.ViewSet):
                     if tenant_data.phone_number:
                         tenant.phone_number = tenant_data.phone_number
                     tenant.save()
+                    # Cached tenancy lists show renter names and emails
+                    Tenancy.invalidate_list_cache()
                 except User.DoesNotExist:
                     # Create new tenant user
                     is_new_user = True
                     temporary_password = User.objects.make_random_password(length=16)
 
+                    # Created without a password; it is hashed in the
+                    # background along with the welcome email
                     tenant = User.objects.create_user(
                         email=tenant_data.email,
-                        password=temporary_password,
                         first_name=tenant_data.first_name,
                         last_name=tenant_data.last_name,
                         phone_number=tenant_data.phone_number,
@@ -448,19 +487,19 @@ class OnboardingViewSet(viewsets.ViewSet):
                     }
                 )
 
-                if not created:
+                # Only a removed membership needs a write to reactivate it
+                if not created and not membership.is_active:
                     membership.is_active = True
-                    membership.save()
+                    membership.save(update_fields=['is_active'])
 
                 # Update onboarding step
-                if request.user.onboarding_step < 3:
-                    request.user.onboarding_step = 3
-                    request.user.save(update_fields=['onboarding_step'])
+                _advance_onboarding_step(request.user, 3)
 
-            # Send welcome email to new tenants (outside transaction)
+            # Set the password and send the welcome email to new tenants in the
+            # background (outside transaction, so it starts right away)
             if is_new_user and temporary_password:
                 landlord_name = request.user.get_full_name() or request.user.email
-                send_welcome_email(tenant, temporary_password, landlord_name)
+                run_after_commit(welcome_new_tenant, tenant, temporary_password, landlord_name)
 
             tenant_serializer = UserSerializer(tenant)
             return Response(tenant_serializer.data, status=status.HTTP_201_CREATED)
@@ -471,7 +510,7 @@ class OnboardingViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error adding tenant: {str(e)}")
+            logger.error("Error adding tenant: %s", e)
             return Response(
                 {'error': 'Failed to add tenant'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -489,19 +528,21 @@ class OnboardingViewSet(viewsets.ViewSet):
         - Has at least one tenancy OR household members (for backward compatibility)
         """
         try:
-            # Check if all required steps are completed
-            has_household = Household.objects.filter(landlord=request.user).exists()
-
-            # Check for tenancies (new system)
-            has_tenancy = Tenancy.objects.filter(
-                household__landlord=request.user
-            ).exists()
-
-            # Check for household memberships (legacy system - backward compatibility)
-            has_household_members = HouseholdMembership.objects.filter(
-                household__landlord=request.user,
-                is_active=True
-            ).exists()
+            # Check all required steps with one query:
+            # - a household
+            # - a tenancy (new system)
+            # - household memberships (legacy system - backward compatibility)
+            flags = User.objects.filter(pk=request.user.pk).values(
+                has_household=Exists(Household.objects.filter(landlord=OuterRef('pk'))),
+                has_tenancy=Exists(Tenancy.objects.filter(household__landlord=OuterRef('pk'))),
+                has_household_members=Exists(HouseholdMembership.objects.filter(
+                    household__landlord=OuterRef('pk'),
+                    is_active=True
+                )),
+            ).get()
+            has_household = flags['has_household']
+            has_tenancy = flags['has_tenancy']
+            has_household_members = flags['has_household_members']
 
             if not has_household:
                 return Response(
@@ -521,13 +562,13 @@ class OnboardingViewSet(viewsets.ViewSet):
             request.user.onboarding_step = 4
             request.user.save(update_fields=['is_onboarded', 'onboarding_step'])
 
-            logger.info(f"User {request.user.email} completed onboarding successfully")
+            logger.info("User %s completed onboarding successfully", request.user.email)
 
             serializer = UserSerializer(request.user)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
         except Exception as e:
-            logger.error(f"Error completing onboarding: {str(e)}")
+            logger.error("Error completing onboarding: %s", e)
             return Response(
                 {'error': 'Failed to complete onboarding'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -541,29 +582,39 @@ class OnboardingViewSet(viewsets.ViewSet):
         GET /api/users/onboarding/status/
         """
         try:
-            has_household = Household.objects.filter(landlord=request.user).exists()
+            # The user's own fields arrive with the request; only the two
+            # existence checks need the database, so only they are cached.
+            cache_key = Household.onboarding_cache_key(request.user.pk)
+            flags = cache.get(cache_key)
+            if flags is None:
+                # Both EXISTS checks in a single round trip
+                flags = User.objects.filter(pk=request.user.pk).values(
+                    household_created=Exists(Household.objects.filter(landlord=OuterRef('pk'))),
+                    tenants_added=Exists(HouseholdMembership.objects.filter(
+                        household__landlord=OuterRef('pk'),
+                        is_active=True
+                    )),
+                ).get()
+                cache.set(cache_key, flags, ONBOARDING_STATUS_CACHE_TIMEOUT)
+
             landlord_info_complete = bool(
                 request.user.first_name and
                 request.user.last_name and
                 request.user.phone_number
             )
-            has_tenants = HouseholdMembership.objects.filter(
-                household__landlord=request.user,
-                is_active=True
-            ).exists()
 
             status_data = {
                 'is_onboarded': request.user.is_onboarded,
                 'onboarding_step': request.user.onboarding_step,
-                'household_created': has_household,
+                'household_created': flags['household_created'],
                 'landlord_info_complete': landlord_info_complete,
-                'tenants_added': has_tenants,
+                'tenants_added': flags['tenants_added'],
             }
 
             return Response(status_data, status=status.HTTP_200_OK)
 
         except Exception as e:
-            logger.error(f"Error getting onboarding status: {str(e)}")
+            logger.error("Error getting onboarding status: %s", e)
             return Response(
                 {'error': 'Failed to get onboarding status'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
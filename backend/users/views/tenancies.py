@@ -2,11 +2,18 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.http import Http404, QueryDict
+from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.db import transaction, models
+from django.core.cache import cache
+from django.db import transaction, models, IntegrityError
+from django.db.models import Exists, OuterRef, prefetch_related_objects
 from django.core.exceptions import ValidationError as DjangoValidationError
 from pydantic import ValidationError as PydanticValidationError
+from functools import wraps
+from urllib.parse import urlencode
 
+from project.pagination import StandardPageNumberPagination
 from ..models import Tenancy, Renter, Household, User, TenantInvitation
 from ..serializers import (
     TenancySerializer,
@@ -19,7 +26,45 @@ from ..schemas import (
     AddRenterSchema,
     StartMoveoutSchema,
 )
-from .households import send_invitation_email
+from .invitations import queue_invitation_email
+
+# Tenancy, renter, household and user-name writes invalidate cached lists
+# on commit; the timeout is only a backstop for writes that bypass them
+TENANCY_LIST_CACHE_TIMEOUT = 300
+
+
+def validate_schema(schema, data):
+    """
+    Validate a request body with a Pydantic schema via model_validate.
+
+    Form bodies arrive as a QueryDict, whose underlying dict holds a list per
+    key; they are flattened to the last value first, as data[key] would give.
+    """
+    if isinstance(data, QueryDict):
+        data = data.dict()
+    return schema.model_validate(data)
+
+
+def landlord_or_admin_required(denied_action):
+    """
+    Restrict a detail action to admins and the tenancy household's landlord.
+
+    The wrapped method receives the tenancy from get_object() after the
+    request's own arguments; anyone else gets a 403 saying they may not
+    perform ``denied_action``.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            tenancy = self.get_object()
+            if not request.user.is_admin() and tenancy.household.landlord_id != request.user.pk:
+                return Response({
+                    'success': False,
+                    'error': f'You do not have permission to {denied_action}.'
+                }, status=status.HTTP_403_FORBIDDEN)
+            return view_method(self, request, tenancy, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
 class TenancyViewSet(viewsets.ModelViewSet):
@@ -27,6 +72,7 @@ class TenancyViewSet(viewsets.ModelViewSet):
 
     serializer_class = TenancySerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = StandardPageNumberPagination
 
     def get_queryset(self):
         """Return tenancies based on user role."""
@@ -34,13 +80,18 @@ class TenancyViewSet(viewsets.ModelViewSet):
 
         if user.is_admin():
             # Admins see all tenancies
-            return Tenancy.objects.all()
+            queryset = Tenancy.objects.all()
         elif user.is_landlord():
             # Landlords see tenancies for their households
-            return Tenancy.objects.filter(household__landlord=user)
+            queryset = Tenancy.objects.filter(household__landlord=user)
         else:
-            # Tenants see only tenancies they're part of
-            return Tenancy.objects.filter(renters__user=user).distinct()
+            # Tenants see only tenancies they're part of. EXISTS avoids the
+            # duplicate rows a join would produce, so no DISTINCT is needed.
+            queryset = Tenancy.objects.filter(Exists(
+                Renter.objects.filter(tenancy=OuterRef('pk'), user=user)
+            ))
+
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     def get_serializer_class(self):
         """Use list serializer for list action."""
@@ -48,50 +99,77 @@ class TenancyViewSet(viewsets.ModelViewSet):
             return TenancyListSerializer
         return TenancySerializer
 
-    def list(self, request, *args, **kwargs):
-        """List tenancies with optional filtering."""
-        queryset = self.get_queryset()
+    def filter_queryset(self, queryset):
+        """Apply the optional status, household and search query parameters."""
+        queryset = super().filter_queryset(queryset)
+        query_params = self.request.query_params
 
         # Filter by status if provided
-        status_filter = request.query_params.get('status')
+        status_filter = query_params.get('status')
         if status_filter:
             queryset = queryset.filter(status=status_filter)
 
         # Filter by household if provided
-        household_id = request.query_params.get('household')
+        household_id = query_params.get('household')
         if household_id:
             queryset = queryset.filter(household_id=household_id)
 
-        # Search by household name or renter name
-        search = request.query_params.get('search')
+        # Search by household name or renter name. Renters are matched in an
+        # EXISTS subquery, so tenancies are not multiplied per renter and no
+        # DISTINCT is needed.
+        search = query_params.get('search')
         if search:
+            renter_match = Exists(Renter.objects.filter(
+                models.Q(user__first_name__icontains=search) |
+                models.Q(user__last_name__icontains=search) |
+                models.Q(user__email__icontains=search),
+                tenancy=OuterRef('pk'),
+            ))
             queryset = queryset.filter(
-                models.Q(household__name__icontains=search) |
-                models.Q(renters__user__first_name__icontains=search) |
-                models.Q(renters__user__last_name__icontains=search) |
-                models.Q(renters__user__email__icontains=search)
-            ).distinct()
+                models.Q(household__name__icontains=search) | renter_match
+            )
 
-        queryset = queryset.select_related('household').prefetch_related('renters__user')
+        return queryset
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'success': True,
-            'results': serializer.data
-        })
+    def list(self, request, *args, **kwargs):
+        """List a page of tenancies with optional filtering."""
+        # A per-process cache cannot see other workers' invalidations
+        if not settings.CACHE_LIST_RESPONSES:
+            return Response(self._list_page_data())
+
+        # Cached per user and query; tenancy, renter, household and renter
+        # name writes bump the list version so stale pages are never served
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        cache_key = Tenancy.list_cache_key(request.user.pk, query)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._list_page_data()
+            cache.set(cache_key, data, TENANCY_LIST_CACHE_TIMEOUT)
+        return Response(data)
+
+    def _list_page_data(self):
+        """Serialize the requested page of tenancies into the list response body."""
+        # Filtering happens in SQL before LIMIT/OFFSET, so only one page of
+        # tenancies is loaded and serialized
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        serializer = self.get_serializer(page, many=True)
+        return {'success': True, **self.get_paginated_response(serializer.data).data}
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
         """Create a new tenancy."""
         try:
             # Validate with Pydantic
-            data_dict = request.data.copy()
-            create_schema = TenancyCreateSchema(**data_dict)
+            create_schema = validate_schema(TenancyCreateSchema, request.data)
 
-            # Check household exists and user has permission
-            household = get_object_or_404(Household, id=create_schema.household_id)
+            # Check household exists and user has permission. Locking the row
+            # serializes concurrent tenancy writes for the same household.
+            household = get_object_or_404(
+                Household.objects.select_for_update(),
+                id=create_schema.household_id
+            )
 
-            if not request.user.is_admin() and household.landlord != request.user:
+            if not request.user.is_admin() and household.landlord_id != request.user.pk:
                 return Response({
                     'success': False,
                     'error': 'You do not have permission to create tenancies for this household.'
@@ -109,29 +187,35 @@ class TenancyViewSet(viewsets.ModelViewSet):
 
             tenancy = Tenancy(**tenancy_data)
 
-            # Validate (includes checking active constraint)
+            # Validate. Tenancy.clean() already checks for another active
+            # tenancy under the household lock, so the constraint validation
+            # would only repeat that query; the database constraint still
+            # backs it on save.
             try:
-                tenancy.full_clean()
+                tenancy.full_clean(validate_constraints=False)
             except DjangoValidationError as e:
                 return Response({
                     'success': False,
                     'error': str(e.message_dict) if hasattr(e, 'message_dict') else str(e)
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            tenancy.save()
+            try:
+                with transaction.atomic():
+                    tenancy.save()
+            except IntegrityError:
+                return Response({
+                    'success': False,
+                    'error': f'Household "{household.name}" already has an active tenancy. '
+                             'Please move out the current tenancy before activating a new one.'
+                }, status=status.HTTP_400_BAD_REQUEST)
 
             # Add initial renters if provided
             if create_schema.renters:
-                for renter_data in create_schema.renters:
-                    self._add_renter_to_tenancy(
-                        tenancy=tenancy,
-                        email=renter_data.email,
-                        first_name=renter_data.first_name,
-                        last_name=renter_data.last_name,
-                        is_primary=renter_data.is_primary,
-                        invited_by=request.user
-                    )
+                self._add_renters_to_new_tenancy(tenancy, create_schema.renters, request.user)
 
+            # The new tenancy skipped get_queryset, so load renters and their
+            # users the way the detail actions do before serializing
+            prefetch_related_objects([tenancy], *TenancySerializer.prefetch_related_fields)
             serializer = TenancySerializer(tenancy)
             return Response({
                 'success': True,
@@ -141,7 +225,7 @@ class TenancyViewSet(viewsets.ModelViewSet):
         except PydanticValidationError as e:
             return Response({
                 'success': False,
-                'errors': e.errors()
+                'errors': e.errors(include_url=False)
             }, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({
@@ -159,43 +243,39 @@ class TenancyViewSet(viewsets.ModelViewSet):
         })
 
     @transaction.atomic
-    def update(self, request, *args, **kwargs):
+    @landlord_or_admin_required('update this tenancy')
+    def update(self, request, tenancy, *args, **kwargs):
         """Update a tenancy."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to update this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
         try:
             # Validate with Pydantic
-            update_schema = TenancyUpdateSchema(**request.data)
+            update_schema = validate_schema(TenancyUpdateSchema, request.data)
 
             # Update fields
-            if update_schema.start_date is not None:
-                tenancy.start_date = update_schema.start_date
-            if update_schema.end_date is not None:
-                tenancy.end_date = update_schema.end_date
-            if update_schema.monthly_rent is not None:
-                tenancy.monthly_rent = update_schema.monthly_rent
-            if update_schema.deposit is not None:
-                tenancy.deposit = update_schema.deposit
-            if update_schema.status is not None:
-                tenancy.status = update_schema.status
-
-            # Validate
+            changed = []
+            for field in ('start_date', 'end_date', 'monthly_rent', 'deposit', 'status'):
+                value = getattr(update_schema, field)
+                if value is not None:
+                    setattr(tenancy, field, value)
+                    changed.append(field)
+
+            # Only a status change can clash with the active-tenancy constraint
+            if 'status' in changed:
+                self._lock_household(tenancy.household_id)
+
+            # Validate only the fields that changed; unchanged ones were
+            # validated when they were last saved
             try:
-                tenancy.full_clean()
+                tenancy.full_clean(
+                    exclude=[f.name for f in Tenancy._meta.fields if f.name not in changed],
+                    validate_unique='status' in changed
+                )
             except DjangoValidationError as e:
                 return Response({
                     'success': False,
                     'error': str(e.message_dict) if hasattr(e, 'message_dict') else str(e)
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            tenancy.save()
+            tenancy.save(update_fields=[*changed, 'updated_at'])
 
             serializer = TenancySerializer(tenancy)
             return Response({
@@ -206,7 +286,7 @@ class TenancyViewSet(viewsets.ModelViewSet):
         except PydanticValidationError as e:
             return Response({
                 'success': False,
-                'errors': e.errors()
+                'errors': e.errors(include_url=False)
             }, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({
@@ -214,20 +294,12 @@ class TenancyViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
 
-    def destroy(self, request, *args, **kwargs):
+    @landlord_or_admin_required('delete this tenancy')
+    def destroy(self, request, tenancy, *args, **kwargs):
         """Delete a tenancy (soft delete by setting inactive)."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to delete this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
         # Change status to moved_out instead of hard delete
         tenancy.status = 'moved_out'
-        tenancy.save()
+        tenancy.save(update_fields=['status', 'updated_at'])
 
         return Response({
             'success': True,
@@ -236,20 +308,12 @@ class TenancyViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['post'])
     @transaction.atomic
-    def add_renter(self, request, pk=None):
+    @landlord_or_admin_required('add renters to this tenancy')
+    def add_renter(self, request, tenancy, pk=None):
         """Add a renter to a tenancy."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to add renters to this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
         try:
             # Validate with Pydantic
-            renter_schema = AddRenterSchema(**request.data)
+            renter_schema = validate_schema(AddRenterSchema, request.data)
 
             # Add renter
             renter = self._add_renter_to_tenancy(
@@ -271,7 +335,7 @@ class TenancyViewSet(viewsets.ModelViewSet):
         except PydanticValidationError as e:
             return Response({
                 'success': False,
-                'errors': e.errors()
+                'errors': e.errors(include_url=False)
             }, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as e:
             return Response({
@@ -280,20 +344,16 @@ class TenancyViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=True, methods=['delete'], url_path='renters/(?P<renter_id>[^/.]+)')
-    def remove_renter(self, request, pk=None, renter_id=None):
+    @landlord_or_admin_required('remove renters from this tenancy')
+    def remove_renter(self, request, tenancy, pk=None, renter_id=None):
         """Remove a renter from a tenancy."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to remove renters from this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
-        # Get and delete renter
-        renter = get_object_or_404(Renter, id=renter_id, tenancy=tenancy)
-        renter.delete()
+        # Delete in one statement; nothing depends on Renter rows, so the
+        # queryset delete needs no fetch. It skips Renter.delete(), so the
+        # list cache is invalidated here.
+        deleted, _ = Renter.objects.filter(id=renter_id, tenancy=tenancy).delete()
+        if not deleted:
+            raise Http404('No Renter matches the given query.')
+        Tenancy.invalidate_list_cache()
 
         return Response({
             'success': True,
@@ -301,33 +361,25 @@ class TenancyViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['post'])
-    def activate(self, request, pk=None):
+    @transaction.atomic
+    @landlord_or_admin_required('activate this tenancy')
+    def activate(self, request, tenancy, pk=None):
         """Activate a tenancy (change status to active)."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to activate this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
-        # Check if another active tenancy exists
-        existing_active = Tenancy.objects.filter(
-            household=tenancy.household,
-            status='active'
-        ).exclude(pk=tenancy.pk)
+        self._lock_household(tenancy.household_id)
 
-        if existing_active.exists():
+        # The one_active_tenancy_per_household constraint rejects a second
+        # active tenancy; the savepoint keeps the outer transaction usable.
+        tenancy.status = 'active'
+        try:
+            with transaction.atomic():
+                tenancy.save(update_fields=['status', 'updated_at'])
+        except IntegrityError:
             return Response({
                 'success': False,
                 'error': f'Household "{tenancy.household.name}" already has an active tenancy. '
                          'Please move out the current tenancy before activating a new one.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        tenancy.status = 'active'
-        tenancy.save()
-
         serializer = TenancySerializer(tenancy)
         return Response({
             'success': True,
@@ -336,24 +388,16 @@ class TenancyViewSet(viewsets.ModelViewSet):
         })
 
     @action(detail=True, methods=['post'])
-    def start_moveout(self, request, pk=None):
+    @landlord_or_admin_required('start move-out for this tenancy')
+    def start_moveout(self, request, tenancy, pk=None):
         """Start the move-out process (change status to moving_out and set end_date)."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to start move-out for this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
         try:
             # Validate with Pydantic
-            moveout_schema = StartMoveoutSchema(**request.data)
+            moveout_schema = validate_schema(StartMoveoutSchema, request.data)
 
             tenancy.status = 'moving_out'
             tenancy.end_date = moveout_schema.end_date
-            tenancy.save()
+            tenancy.save(update_fields=['status', 'end_date', 'updated_at'])
 
             serializer = TenancySerializer(tenancy)
             return Response({
@@ -365,23 +409,15 @@ class TenancyViewSet(viewsets.ModelViewSet):
         except PydanticValidationError as e:
             return Response({
                 'success': False,
-                'errors': e.errors()
+                'errors': e.errors(include_url=False)
             }, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=True, methods=['post'])
-    def mark_moved_out(self, request, pk=None):
+    @landlord_or_admin_required('mark this tenancy as moved out')
+    def mark_moved_out(self, request, tenancy, pk=None):
         """Mark tenancy as moved out (change status to moved_out)."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to mark this tenancy as moved out.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
         tenancy.status = 'moved_out'
-        tenancy.save()
+        tenancy.save(update_fields=['status', 'updated_at'])
 
         serializer = TenancySerializer(tenancy)
         return Response({
@@ -391,80 +427,31 @@ class TenancyViewSet(viewsets.ModelViewSet):
         })
 
     @action(detail=True, methods=['post'])
-    def upload_proof(self, request, pk=None):
+    @landlord_or_admin_required('upload proof for this tenancy')
+    def upload_proof(self, request, tenancy, pk=None):
         """Upload proof document for a tenancy."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to upload proof for this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
-        # Get file from request
-        file = request.FILES.get('file')
-        if not file:
-            return Response({
-                'success': False,
-                'error': 'No file provided.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        # Save file
-        tenancy.proof_document = file
-        tenancy.save()
-
-        serializer = TenancySerializer(tenancy)
-        return Response({
-            'success': True,
-            'data': serializer.data,
-            'message': 'Proof document uploaded successfully.'
-        })
+        return self._store_upload(request, tenancy, 'proof_document', 'Proof document uploaded successfully.')
 
     @action(detail=True, methods=['post'])
-    def upload_inventory_report(self, request, pk=None):
+    @landlord_or_admin_required('upload inventory report for this tenancy')
+    def upload_inventory_report(self, request, tenancy, pk=None):
         """Upload inventory report for a tenancy."""
-        tenancy = self.get_object()
-
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to upload inventory report for this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
-
-        # Get file from request
-        file = request.FILES.get('file')
-        if not file:
-            return Response({
-                'success': False,
-                'error': 'No file provided.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
-        # Save file
-        tenancy.inventory_report = file
-        tenancy.save()
-
-        serializer = TenancySerializer(tenancy)
-        return Response({
-            'success': True,
-            'data': serializer.data,
-            'message': 'Inventory report uploaded successfully.'
-        })
+        return self._store_upload(request, tenancy, 'inventory_report', 'Inventory report uploaded successfully.')
 
     @action(detail=True, methods=['post'])
-    def upload_checkout_reading(self, request, pk=None):
+    @landlord_or_admin_required('upload checkout reading for this tenancy')
+    def upload_checkout_reading(self, request, tenancy, pk=None):
         """Upload checkout reading for a tenancy."""
-        tenancy = self.get_object()
+        return self._store_upload(request, tenancy, 'checkout_reading', 'Checkout reading uploaded successfully.')
 
-        # Check permissions
-        if not request.user.is_admin() and tenancy.household.landlord != request.user:
-            return Response({
-                'success': False,
-                'error': 'You do not have permission to upload checkout reading for this tenancy.'
-            }, status=status.HTTP_403_FORBIDDEN)
+    def _store_upload(self, request, tenancy, field_name, message):
+        """
+        Store the request's 'file' in one of the tenancy's document fields.
 
-        # Get file from request
+        Uploads are stored on the local filesystem, where large files are
+        already on disk and saving moves them into MEDIA_ROOT, so this stays
+        in the request.
+        """
         file = request.FILES.get('file')
         if not file:
             return Response({
@@ -472,62 +459,122 @@ class TenancyViewSet(viewsets.ModelViewSet):
                 'error': 'No file provided.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Save file
-        tenancy.checkout_reading = file
-        tenancy.save()
+        setattr(tenancy, field_name, file)
+        tenancy.save(update_fields=[field_name, 'updated_at'])
 
         serializer = TenancySerializer(tenancy)
         return Response({
             'success': True,
             'data': serializer.data,
-            'message': 'Checkout reading uploaded successfully.'
+            'message': message
         })
 
-    def _add_renter_to_tenancy(self, tenancy, email, first_name, last_name, is_primary, invited_by):
-        """Helper method to add a renter to a tenancy."""
-        # Check if user exists
-        try:
-            user = User.objects.get(email=email)
-
-            # Check if user is already a renter in this tenancy
-            if Renter.objects.filter(tenancy=tenancy, user=user).exists():
+    def _lock_household(self, household_id):
+        """
+        Take a row lock on the household for the rest of the transaction.
+
+        Tenancy writes that may touch the active-tenancy constraint lock the
+        parent household first, so concurrent activations for the same
+        household run one after another instead of racing the check.
+        """
+        return Household.objects.select_for_update().get(pk=household_id)
+
+    def _add_renters_to_new_tenancy(self, tenancy, renters, invited_by):
+        """
+        Add the initial renters of a freshly created tenancy in bulk.
+
+        Mirrors _add_renter_to_tenancy for each renter, but looks up existing
+        users in one query and inserts new users, renters and invitations with
+        one bulk_create each. Renter.save() is bypassed, so only the last
+        renter marked primary is kept primary, as sequential saves would.
+        """
+        emails = [User.objects.normalize_email(renter.email) for renter in renters]
+        seen = set()
+        for email in emails:
+            if email in seen:
                 raise ValueError(f'User {email} is already a renter in this tenancy.')
+            seen.add(email)
 
-            # Add as renter
-            renter = Renter.objects.create(
-                tenancy=tenancy,
-                user=user,
-                is_primary=is_primary
-            )
-
-            return renter
-
-        except User.DoesNotExist:
-            # User doesn't exist - create inactive user and send invitation
-            # Create inactive user
-            user = User.objects.create(
+        users = User.objects.in_bulk(emails, field_name='email')
+        new_users = [
+            User(
                 email=email,
-                first_name=first_name or '',
-                last_name=last_name or '',
+                first_name=renter.first_name or '',
+                last_name=renter.last_name or '',
                 is_active=False,
                 role='tenant'
             )
+            for email, renter in zip(emails, renters) if email not in users
+        ]
+        User.objects.bulk_create(new_users)
+        users.update((user.email, user) for user in new_users)
+
+        primary_email = next(
+            (email for email, renter in zip(reversed(emails), reversed(renters)) if renter.is_primary),
+            None
+        )
+        Renter.objects.bulk_create([
+            Renter(tenancy=tenancy, user=users[email], is_primary=email == primary_email)
+            for email in emails
+        ])
+
+        # Users created here have no account yet, so invite them
+        invitations = [
+            TenantInvitation(email=user.email, household=tenancy.household, invited_by=invited_by)
+            for user in new_users
+        ]
+        for invitation in invitations:
+            invitation.set_defaults()
+        TenantInvitation.objects.bulk_create(invitations)
+
+        # Send invitation emails once the tenancy transaction commits
+        for invitation in invitations:
+            queue_invitation_email(invitation)
 
-            # Create renter record
-            renter = Renter.objects.create(
-                tenancy=tenancy,
-                user=user,
-                is_primary=is_primary
-            )
+    def _add_renter_to_tenancy(self, tenancy, email, first_name, last_name, is_primary, invited_by):
+        """Helper method to add a renter to a tenancy."""
+        # Normalize the way create_user() stores addresses so the lookup is
+        # an exact match on the unique email index
+        email = User.objects.normalize_email(email)
+        user = User.objects.filter(email=email).first()
+
+        if user is not None:
+            # Add as renter; the (tenancy, user) unique constraint rejects
+            # duplicates and the savepoint keeps the outer transaction usable.
+            try:
+                with transaction.atomic():
+                    return Renter.objects.create(
+                        tenancy=tenancy,
+                        user=user,
+                        is_primary=is_primary
+                    )
+            except IntegrityError:
+                raise ValueError(f'User {email} is already a renter in this tenancy.')
 
-            # Create invitation
-            invitation = TenantInvitation.objects.create(
-                email=email,
-                household=tenancy.household,
-                invited_by=invited_by
-            )
+        # User doesn't exist - create inactive user and send invitation
+        user = User.objects.create(
+            email=email,
+            first_name=first_name or '',
+            last_name=last_name or '',
+            is_active=False,
+            role='tenant'
+        )
+
+        # Create renter record
+        renter = Renter.objects.create(
+            tenancy=tenancy,
+            user=user,
+            is_primary=is_primary
+        )
+
+        # Create invitation
+        invitation = TenantInvitation.objects.create(
+            email=email,
+            household=tenancy.household,
+            invited_by=invited_by
+        )
 
-            # Send invitation email
-            send_invitation_email(invitation)
+        # Send invitation email once the tenancy transaction commits
+        queue_invitation_email(invitation)
 
-            return renter
+        return renter
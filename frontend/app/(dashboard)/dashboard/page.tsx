@@ -13,7 +13,6 @@ import {
   Badge,
 } from "@/app/components/ui";
 import { BuildingOfficeIcon, UserGroupIcon, PlusIcon, XMarkIcon, RocketLaunchIcon } from "@heroicons/react/24/outline";
-import type { Household } from "@/types/household";
 
 interface TenantRow {
   id: number;
@@ -31,7 +30,7 @@ export default function DashboardPage() {
   const router = useRouter();
   const user = (session?.user as any);
   const userRole = user?.role || 'tenant';
-  const [households, setHouseholds] = useState<Household[]>([]);
+  const [householdCount, setHouseholdCount] = useState(0);
   const [tenants, setTenants] = useState<TenantRow[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState("");
@@ -68,7 +67,7 @@ export default function DashboardPage() {
       // Fetch all households for the landlord
       const response = await householdsAPI.list(accessToken);
       const householdsData = response.results || [];
-      setHouseholds(householdsData);
+      setHouseholdCount(response.count);
 
       // Extract all tenants from households
       const allTenants: TenantRow[] = [];
@@ -169,11 +168,11 @@ export default function DashboardPage() {
                       <div className="flex-1 bg-blue-300 rounded-full h-2">
                         <div
                           className="bg-blue-700 rounded-full h-2 transition-all duration-300"
-                          style={{ width: `${Math.min((households.length / 1) * 100, 100)}%` }}
+                          style={{ width: `${Math.min((householdCount / 1) * 100, 100)}%` }}
                         />
                       </div>
                       <span className="text-sm text-blue-800 font-medium">
-                        {households.length} household{households.length !== 1 ? 's' : ''} added
+                        {householdCount} household{householdCount !== 1 ? 's' : ''} added
                       </span>
                     </div>
                     <div className="flex items-center space-x-3">
@@ -209,7 +208,7 @@ export default function DashboardPage() {
                     {userRole === 'tenant' ? 'Your Household' : 'Total Households'}
                   </p>
                   <p className="text-3xl font-semibold text-text-primary">
-                    {households.length}
+                    {householdCount}
                   </p>
                 </div>
               </div>
@@ -20,6 +20,7 @@ import type {
   TenancyConfirmData,
   RenterExtractedData,
   ExtractedRenterWithId,
+  TenancyAgreement,
 } from "@/types/onboarding";
 import type { Household } from "@/types/household";
 import {
@@ -43,6 +44,10 @@ const initialOnboardingSteps = [
   { label: "Tenants", description: "Review & add" },
 ];
 
+// Background extraction polling: every 2 seconds for up to 2 minutes
+const EXTRACTION_POLL_INTERVAL_MS = 2000;
+const EXTRACTION_POLL_ATTEMPTS = 60;
+
 const addHouseholdSteps = [
   { label: "Property", description: "Add household details" },
   { label: "Tenancies", description: "Upload agreements" },
@@ -227,6 +232,54 @@ export default function OnboardingPage() {
     }
   };
 
+  // Poll an uploaded agreement until its background extraction finishes,
+  // giving up after EXTRACTION_POLL_ATTEMPTS polls
+  const waitForExtraction = async (agreement: TenancyAgreement): Promise<TenancyAgreement> => {
+    let current = agreement;
+    for (
+      let attempt = 0;
+      attempt < EXTRACTION_POLL_ATTEMPTS &&
+      (current.status === "pending" || current.status === "processing");
+      attempt++
+    ) {
+      await new Promise((resolve) => setTimeout(resolve, EXTRACTION_POLL_INTERVAL_MS));
+      current = await onboardingAPI.getTenancyAgreement(agreement.id, accessToken);
+    }
+    return current;
+  };
+
+  // Show an agreement's extraction result on its file and pre-fill its
+  // tenancy form, or offer a manual retry
+  const applyExtraction = (fileId: string, agreement: TenancyAgreement) => {
+    if (agreement.status !== "processed" || !agreement.extracted_data) {
+      // Failed or still running: the retry button calls the process endpoint
+      setUploadedFiles((prev) =>
+        prev.map((f) => (f.id === fileId ? { ...f, status: "uploaded" as const } : f))
+      );
+      return;
+    }
+
+    const extracted = agreement.extracted_data;
+    setUploadedFiles((prev) =>
+      prev.map((f) =>
+        f.id === fileId
+          ? { ...f, status: "processed" as const, extractedData: extracted }
+          : f
+      )
+    );
+
+    setTenancyFormData((prev) => ({
+      ...prev,
+      [fileId]: prev[fileId] || {
+        tenancy_name: '',
+        start_date: extracted.start_date || '',
+        end_date: extracted.end_date || '',
+        monthly_rent: extracted.monthly_rent?.toString() || '',
+        deposit: extracted.deposit?.toString() || '',
+      },
+    }));
+  };
+
   // Step 3: Handle file upload
   const handleFilesUpload = async (files: File[]) => {
     if (!createdHousehold) return;
@@ -247,43 +300,30 @@ export default function OnboardingPage() {
     // Upload each file
     for (const uploadedFile of newFiles) {
       try {
-        const agreement = await onboardingAPI.uploadTenancyAgreement(
+        const uploaded = await onboardingAPI.uploadTenancyAgreement(
           createdHousehold.id,
           uploadedFile.file,
           accessToken
         );
 
-        // Update file status and initialize form data if extraction completed
-        const fileStatus = agreement.status === 'processed' ? 'processed' : 'uploaded';
-
+        // Extraction runs in the background; show it as processing until
+        // the agreement leaves pending/processing
         setUploadedFiles((prev) =>
           prev.map((f) =>
             f.id === uploadedFile.id
               ? {
                   ...f,
-                  status: fileStatus,
+                  status: "processing" as const,
                   progress: 100,
-                  agreementId: agreement.id,
-                  extractedData: agreement.extracted_data || undefined,
-                  url: agreement.file,
+                  agreementId: uploaded.id,
+                  url: uploaded.file,
                 }
               : f
           )
         );
 
-        // Initialize form data if extraction completed
-        if (agreement.status === 'processed' && agreement.extracted_data) {
-          setTenancyFormData((prev) => ({
-            ...prev,
-            [uploadedFile.id]: {
-              tenancy_name: '',
-              start_date: agreement.extracted_data?.start_date || '',
-              end_date: agreement.extracted_data?.end_date || '',
-              monthly_rent: agreement.extracted_data?.monthly_rent?.toString() || '',
-              deposit: agreement.extracted_data?.deposit?.toString() || '',
-            },
-          }));
-        }
+        const agreement = await waitForExtraction(uploaded);
+        applyExtraction(uploadedFile.id, agreement);
       } catch (err: any) {
         setUploadedFiles((prev) =>
           prev.map((f) =>
@@ -312,22 +352,24 @@ export default function OnboardingPage() {
     );
 
     try {
-      const agreement = await onboardingAPI.processTenancyAgreement(
-        file.agreementId,
-        accessToken
-      );
+      let agreement: TenancyAgreement;
+      try {
+        agreement = await onboardingAPI.processTenancyAgreement(
+          file.agreementId,
+          accessToken
+        );
+      } catch (err: any) {
+        // 409: the background extraction is still running; wait for it
+        if (err.response?.status !== 409) throw err;
+        agreement = await waitForExtraction(
+          await onboardingAPI.getTenancyAgreement(file.agreementId, accessToken)
+        );
+      }
 
-      setUploadedFiles((prev) =>
-        prev.map((f) =>
-          f.id === fileId
-            ? {
-                ...f,
-                status: "processed" as const,
-                extractedData: agreement.extracted_data || undefined,
-              }
-            : f
-        )
-      );
+      if (agreement.status !== "processed") {
+        throw new Error("Extraction did not complete");
+      }
+      applyExtraction(fileId, agreement);
 
       // Add renters to extracted tenants if available
       if (agreement.extracted_data?.renters && agreement.extracted_data.renters.length > 0) {
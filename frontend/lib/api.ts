@@ -11,6 +11,7 @@ import type {
   TenancyConfirmData,
 } from '@/types/onboarding';
 import type { AnalyticsResponse } from '@/types/analytics';
+import type { PaginatedResponse } from '@/types/pagination';
 import type { TasksResponse, Task, CreateTaskData, UpdateTaskData, TaskFilters } from '@/types/tasks';
 import type { VerifyInvitationResponse, AcceptInvitationData, AcceptInvitationResponse } from '@/types/invitations';
 import type {
@@ -36,6 +37,27 @@ export const api = axios.create({
   withCredentials: true,
 });
 
+// Fetch every page of a paginated list endpoint by following `next`,
+// returning the first page's envelope with all results combined
+async function fetchAllPages<R extends PaginatedResponse<unknown>>(
+  url: string,
+  accessToken: string,
+  params?: object
+): Promise<R> {
+  const headers = { Authorization: `Bearer ${accessToken}` };
+  const first = await api.get<R>(url, { params, headers });
+  const results = [...first.data.results];
+
+  let next = first.data.next;
+  while (next) {
+    const page = await api.get<R>(next, { headers });
+    results.push(...page.data.results);
+    next = page.data.next;
+  }
+
+  return { ...first.data, next: null, results };
+}
+
 // Auth API functions
 export const authAPI = {
   async login(credentials: LoginCredentials): Promise<LoginResponse> {
@@ -112,13 +134,8 @@ export const authAPI = {
 
 // Households API functions
 export const householdsAPI = {
-  async list(accessToken: string): Promise<{ results: Household[] }> {
-    const response = await api.get<{ results: Household[] }>('/api/users/households/', {
-      headers: {
-        Authorization: `Bearer ${accessToken}`,
-      },
-    });
-    return response.data;
+  async list(accessToken: string): Promise<PaginatedResponse<Household>> {
+    return fetchAllPages<PaginatedResponse<Household>>('/api/users/households/', accessToken);
   },
 
   async get(id: number, accessToken: string): Promise<Household> {
@@ -247,6 +264,21 @@ export const onboardingAPI = {
     return response.data;
   },
 
+  async getTenancyAgreement(
+    agreementId: number,
+    accessToken: string
+  ): Promise<TenancyAgreement> {
+    const response = await api.get<TenancyAgreement>(
+      `/api/users/onboarding/${agreementId}/agreement/`,
+      {
+        headers: {
+          Authorization: `Bearer ${accessToken}`,
+        },
+      }
+    );
+    return response.data;
+  },
+
   async processTenancyAgreement(
     agreementId: number,
     accessToken: string
@@ -432,13 +464,7 @@ export const invitationsAPI = {
 // Tenancies API functions
 export const tenanciesAPI = {
   async list(accessToken: string, filters?: TenancyFilters): Promise<TenanciesResponse> {
-    const response = await api.get<TenanciesResponse>('/api/users/tenancies/', {
-      params: filters,
-      headers: {
-        Authorization: `Bearer ${accessToken}`,
-      },
-    });
-    return response.data;
+    return fetchAllPages<TenanciesResponse>('/api/users/tenancies/', accessToken, filters);
   },
 
   async get(id: number, accessToken: string): Promise<TenancyResponse> {
@@ -0,0 +1,8 @@
+// Page of results from a list endpoint using the backend's
+// StandardPageNumberPagination
+export interface PaginatedResponse<T> {
+  count: number;
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
@@ -1,3 +1,5 @@
+import type { PaginatedResponse } from './pagination';
+
 export type TenancyStatus = 'future' | 'active' | 'moving_out' | 'moved_out';
 
 export interface RenterUser {
@@ -98,9 +100,8 @@ export interface StartMoveoutData {
   end_date: string;
 }
 
-export interface TenanciesResponse {
+export interface TenanciesResponse extends PaginatedResponse<TenancyListItem> {
   success: boolean;
-  results: TenancyListItem[];
 }
 
 export interface TenancyResponse {